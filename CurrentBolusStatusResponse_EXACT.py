@@ -7,9 +7,10 @@ https://github.com/jwoglom/pumpX2/blob/main/messages/src/main/java/com/jwoglom/p
 Milestone 4 implementation.
 """
 
+import functools
 import struct
-from enum import Enum
-from typing import Optional, Set
+from enum import IntEnum
+from typing import Any, Dict, Optional, Set, Tuple
 from tandem_simulator.protocol.message import Message, MessageRegistry
 
 
@@ -17,6 +18,14 @@ from tandem_simulator.protocol.message import Message, MessageRegistry
 # Utility Functions for Little-Endian Encoding/Decoding
 # =============================================================================
 
+# Compiled once at import so each call skips re-parsing the format string.
+_U16_LE = struct.Struct("<H")
+_U32_LE = struct.Struct("<I")
+
+# Whole 15-byte CurrentBolusStatusResponse payload; the second "H" is the
+# 2-byte zero padding at bytes 3-4.
+_CBS = struct.Struct("<BHHIIBB")
+
 
 def read_uint16_le(data: bytes, offset: int = 0) -> int:
     """Read a 16-bit unsigned integer in little-endian format.
@@ -28,7 +37,7 @@ def read_uint16_le(data: bytes, offset: int = 0) -> int:
     Returns:
         Unsigned 16-bit integer
     """
-    return struct.unpack_from("<H", data, offset)[0]
+    return _U16_LE.unpack_from(data, offset)[0]
 
 
 def read_uint32_le(data: bytes, offset: int = 0) -> int:
@@ -41,7 +50,7 @@ def read_uint32_le(data: bytes, offset: int = 0) -> int:
     Returns:
         Unsigned 32-bit integer
     """
-    return struct.unpack_from("<I", data, offset)[0]
+    return _U32_LE.unpack_from(data, offset)[0]
 
 
 def write_uint16_le(value: int) -> bytes:
@@ -53,7 +62,7 @@ def write_uint16_le(value: int) -> bytes:
     Returns:
         2 bytes in little-endian format
     """
-    return struct.pack("<H", value)
+    return _U16_LE.pack(value)
 
 
 def write_uint32_le(value: int) -> bytes:
@@ -65,7 +74,7 @@ def write_uint32_le(value: int) -> bytes:
     Returns:
         4 bytes in little-endian format
     """
-    return struct.pack("<I", value)
+    return _U32_LE.pack(value)
 
 
 # =============================================================================
@@ -73,7 +82,7 @@ def write_uint32_le(value: int) -> bytes:
 # =============================================================================
 
 
-class CurrentBolusStatus(Enum):
+class CurrentBolusStatus(IntEnum):
     """Enum representing the current bolus delivery status.
 
     Corresponds to the CurrentBolusStatus nested enum in the Java implementation.
@@ -98,10 +107,11 @@ class CurrentBolusStatus(Enum):
         Returns:
             Corresponding CurrentBolusStatus enum value, or None if invalid
         """
-        for status in cls:
-            if status.value == status_id:
-                return status
-        return None
+        return _BOLUS_STATUS_BY_ID.get(status_id)
+
+
+# Precomputed status ID -> enum member lookup used by from_id()
+_BOLUS_STATUS_BY_ID = {status.value: status for status in CurrentBolusStatus}
 
 
 # =============================================================================
@@ -163,6 +173,7 @@ class CurrentBolusStatusResponse(Message):
     """
 
     opcode = 45
+    payload_size = _CBS.size  # Fixed 15-byte payload
 
     def __init__(
         self,
@@ -188,14 +199,23 @@ class CurrentBolusStatusResponse(Message):
             bolus_type_bitmask: Bitmask of bolus types (unsigned byte)
         """
         super().__init__(transaction_id)
-        self.status_id = status_id
-        self.bolus_id = bolus_id
-        self.timestamp = timestamp
-        self.requested_volume = requested_volume
-        self.bolus_source_id = bolus_source_id
-        self.bolus_type_bitmask = bolus_type_bitmask
-
-    def parse_payload(self, payload: bytes) -> None:
+        (
+            self.status_id,
+            self.bolus_id,
+            self.timestamp,
+            self.requested_volume,
+            self.bolus_source_id,
+            self.bolus_type_bitmask,
+        ) = (
+            status_id,
+            bolus_id,
+            timestamp,
+            requested_volume,
+            bolus_source_id,
+            bolus_type_bitmask,
+        )
+
+    def parse_payload(self, payload: bytes, offset: int = 0) -> None:
         """Parse bolus status from payload.
 
         Implements exact byte parsing from Java CurrentBolusStatusResponse.parse():
@@ -206,30 +226,25 @@ class CurrentBolusStatusResponse(Message):
         - Offset 13: bolusSourceId = raw[13]
         - Offset 14: bolusTypeBitmask = raw[14]
 
+        Offsets above are relative to ``offset``, so a caller holding the whole
+        frame (bytes, bytearray or memoryview) can parse it in place without
+        slicing the payload out first.
+
         Args:
-            payload: Raw payload bytes (must be 15 bytes)
+            payload: Raw payload bytes (must be 15 bytes from offset)
+            offset: Byte offset of the payload within the buffer
         """
-        if len(payload) >= 15:
-            # Byte 0: statusId (unsigned byte)
-            self.status_id = payload[0]
-
-            # Bytes 1-2: bolusId (unsigned short, little-endian)
-            self.bolus_id = read_uint16_le(payload, 1)
-
-            # Bytes 3-4: padding (skipped)
-            # (2 zero bytes reserved in the Java implementation)
-
-            # Bytes 5-8: timestamp (unsigned int, little-endian)
-            self.timestamp = read_uint32_le(payload, 5)
-
-            # Bytes 9-12: requestedVolume (unsigned int, little-endian)
-            self.requested_volume = read_uint32_le(payload, 9)
-
-            # Byte 13: bolusSourceId (unsigned byte)
-            self.bolus_source_id = payload[13]
-
-            # Byte 14: bolusTypeBitmask (unsigned byte)
-            self.bolus_type_bitmask = payload[14]
+        if len(payload) - offset >= self.payload_size:
+            # Single fused unpack; the padding short at bytes 3-4 is discarded
+            (
+                self.status_id,
+                self.bolus_id,
+                _,
+                self.timestamp,
+                self.requested_volume,
+                self.bolus_source_id,
+                self.bolus_type_bitmask,
+            ) = _CBS.unpack_from(payload, offset)
 
     def build_payload(self) -> bytes:
         """Build bolus status payload.
@@ -246,14 +261,14 @@ class CurrentBolusStatusResponse(Message):
         Returns:
             15-byte payload buffer
         """
-        return (
-            bytes([self.status_id])  # Byte 0: status
-            + write_uint16_le(self.bolus_id)  # Bytes 1-2: bolus ID
-            + bytes([0, 0])  # Bytes 3-4: padding (zero bytes)
-            + write_uint32_le(self.timestamp)  # Bytes 5-8: timestamp
-            + write_uint32_le(self.requested_volume)  # Bytes 9-12: requested volume
-            + bytes([self.bolus_source_id])  # Byte 13: bolus source
-            + bytes([self.bolus_type_bitmask])  # Byte 14: bolus type bitmask
+        return _CBS.pack(
+            self.status_id,  # Byte 0: status
+            self.bolus_id,  # Bytes 1-2: bolus ID
+            0,  # Bytes 3-4: padding (zero bytes)
+            self.timestamp,  # Bytes 5-8: timestamp
+            self.requested_volume,  # Bytes 9-12: requested volume
+            self.bolus_source_id,  # Byte 13: bolus source
+            self.bolus_type_bitmask,  # Byte 14: bolus type bitmask
         )
 
     # =============================================================================
@@ -344,18 +359,98 @@ class CurrentBolusStatusResponse(Message):
         Returns:
             True if the bolus data is meaningful, False if it's empty/invalid
         """
-        if (
-            self.get_status() == CurrentBolusStatus.ALREADY_DELIVERED_OR_INVALID
-            and self.bolus_id == 0
-            and self.timestamp == 0
-        ):
-            return False
-        return True
+        # ALREADY_DELIVERED_OR_INVALID is status 0 and all three fields are
+        # unsigned, so the OR is zero exactly when the Java condition holds.
+        return (self.status_id | self.bolus_id | self.timestamp) != 0
+
+
+# =============================================================================
+# Batch Parsing
+# =============================================================================
+
+_CBS_FIELDS = (
+    "status_id",
+    "bolus_id",
+    "_pad",
+    "timestamp",
+    "requested_volume",
+    "bolus_source_id",
+    "bolus_type_bitmask",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy_backend() -> Optional[Tuple[Any, Any]]:
+    """Import NumPy for parse_batch() on first use.
+
+    Deferred so that importing the message classes does not load NumPy.
+
+    Returns:
+        (numpy module, packed record dtype matching _CBS), or None if NumPy
+        is not installed
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    # Packed (unaligned) record matching _CBS, itemsize 15
+    dtype = np.dtype(
+        [
+            ("status_id", "u1"),
+            ("bolus_id", "<u2"),
+            ("_pad", "<u2"),
+            ("timestamp", "<u4"),
+            ("requested_volume", "<u4"),
+            ("bolus_source_id", "u1"),
+            ("bolus_type_bitmask", "u1"),
+        ]
+    )
+    return np, dtype
+
+
+def parse_batch(buf: bytes, n: int) -> Dict[str, Any]:
+    """Parse n back-to-back 15-byte CurrentBolusStatusResponse payloads.
+
+    Intended for bulk replay and log processing. Returns one column per
+    field (structure-of-arrays); the padding field is omitted. The column
+    type depends on the environment: with NumPy installed each column is a
+    contiguous ndarray decoded via np.frombuffer, otherwise a list built
+    with Struct.iter_unpack. Both hold the same values.
+
+    Args:
+        buf: Buffer holding at least n * 15 bytes of payloads
+        n: Number of payloads to parse
+
+    Returns:
+        Dict mapping field name to a column of n values
+
+    Raises:
+        ValueError: If n is negative or buf holds fewer than n payloads
+    """
+    if n < 0:
+        raise ValueError(f"Payload count must not be negative, got {n}")
+    if len(buf) < n * _CBS.size:
+        raise ValueError(f"Buffer too short for {n} payloads: got {len(buf)} bytes")
+
+    backend = _numpy_backend()
+    if backend is not None:
+        np, dtype = backend
+        records = np.frombuffer(buf, dtype=dtype, count=n)
+        return {name: np.ascontiguousarray(records[name]) for name in _CBS_FIELDS if name != "_pad"}
+
+    rows = _CBS.iter_unpack(memoryview(buf)[: n * _CBS.size])
+    columns = dict(zip(_CBS_FIELDS, (list(col) for col in zip(*rows))))
+    return {name: columns.get(name, []) for name in _CBS_FIELDS if name != "_pad"}
 
 
 # =============================================================================
 # Message Registration
 # =============================================================================
 
-MessageRegistry.register(CurrentBolusStatusRequest.opcode, CurrentBolusStatusRequest)
-MessageRegistry.register(CurrentBolusStatusResponse.opcode, CurrentBolusStatusResponse)
+MessageRegistry.register_many(
+    (
+        (CurrentBolusStatusRequest.opcode, CurrentBolusStatusRequest),
+        (CurrentBolusStatusResponse.opcode, CurrentBolusStatusResponse),
+    )
+)
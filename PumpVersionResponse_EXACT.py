@@ -22,8 +22,15 @@ Field Layout (48 bytes total):
 """
 
 import struct
+from collections import namedtuple
 from typing import Optional
 
+# Compiled once at import so each call skips re-parsing the format string.
+_U32_LE = struct.Struct("<I")
+
+# Whole 48-byte PumpVersionResponse payload (see field layout above)
+_PVR = struct.Struct("<IIIIII8sI8sI")
+
 
 # Utility functions matching Java Bytes helper class
 def read_uint32_le(data: bytes, offset: int = 0) -> int:
@@ -38,7 +45,7 @@ def read_uint32_le(data: bytes, offset: int = 0) -> int:
     Returns:
         Unsigned 32-bit integer
     """
-    return struct.unpack_from("<I", data, offset)[0]
+    return _U32_LE.unpack_from(data, offset)[0]
 
 
 def write_uint32_le(value: int) -> bytes:
@@ -51,8 +58,11 @@ def write_uint32_le(value: int) -> bytes:
 
     Returns:
         4 bytes in little-endian format
+
+    Raises:
+        struct.error: If value is outside the uint32 range
     """
-    return struct.pack("<I", value & 0xFFFFFFFF)
+    return _U32_LE.pack(value)
 
 
 def read_string(data: bytes, offset: int, length: int) -> str:
@@ -66,11 +76,14 @@ def read_string(data: bytes, offset: int, length: int) -> str:
         length: Number of bytes to read
 
     Returns:
-        String (null-terminated, trailing nulls stripped)
+        String up to the first null terminator (or the full length)
     """
-    raw_bytes = data[offset : offset + length]
-    # Strip null terminators and decode
-    return raw_bytes.rstrip(b'\x00').decode('utf-8', errors='ignore')
+    # Locate the null terminator in place so only the string bytes are copied
+    end = data.find(b"\x00", offset, offset + length)
+    if end < 0:
+        end = offset + length
+    # str() decodes bytes and bytearray slices alike, without a bytes() copy
+    return str(data[offset:end], "utf-8", "ignore")
 
 
 def write_string(value: str, length: int) -> bytes:
@@ -85,10 +98,10 @@ def write_string(value: str, length: int) -> bytes:
     Returns:
         Fixed-length bytes (padded with nulls if necessary)
     """
-    encoded = value.encode('utf-8', errors='ignore')
+    encoded = value.encode("utf-8", errors="ignore")
     # Pad to length with null bytes
     if len(encoded) < length:
-        encoded = encoded + b'\x00' * (length - len(encoded))
+        encoded = encoded + b"\x00" * (length - len(encoded))
     return encoded[:length]
 
 
@@ -103,10 +116,56 @@ def combine(*byte_arrays) -> bytes:
     Returns:
         Combined bytes
     """
-    result = b''
-    for ba in byte_arrays:
-        result += ba
-    return result
+    return b"".join(byte_arrays)
+
+
+def _unpack_payload(raw: bytes) -> tuple:
+    """Unpack a whole payload, mapping a size mismatch to ValueError.
+
+    Struct.unpack requires exactly _PVR.size bytes, so the size check
+    only costs anything on the error path.
+    """
+    try:
+        return _PVR.unpack(raw)
+    except struct.error as e:
+        raise ValueError(f"Invalid payload size: expected {_PVR.size} bytes, got {len(raw)}") from e
+
+
+# Raw decoded fields in wire order; pump_rev and pcba_rev are left as the
+# undecoded 8-byte null-padded values.
+PumpVersionTuple = namedtuple(
+    "PumpVersionTuple",
+    [
+        "arm_sw_ver",
+        "msp_sw_ver",
+        "config_a_bits",
+        "config_b_bits",
+        "serial_num",
+        "part_num",
+        "pump_rev",
+        "pcba_sn",
+        "pcba_rev",
+        "model_num",
+    ],
+)
+
+
+def parse_tuple(raw: bytes) -> PumpVersionTuple:
+    """Decode a payload into a PumpVersionTuple without building a response.
+
+    Pure-decoding fast path for analytics: one unpack, no instance or
+    string decoding.
+
+    Args:
+        raw: Raw payload bytes (must be exactly 48 bytes)
+
+    Returns:
+        PumpVersionTuple with the string fields as raw 8-byte values
+
+    Raises:
+        ValueError: If payload size is not 48 bytes
+    """
+    return PumpVersionTuple._make(_unpack_payload(raw))
 
 
 class PumpVersionResponse:
@@ -115,8 +174,23 @@ class PumpVersionResponse:
     Provides firmware version and hardware information from the pump.
     """
 
+    __slots__ = (
+        "arm_sw_ver",
+        "msp_sw_ver",
+        "config_a_bits",
+        "config_b_bits",
+        "serial_num",
+        "part_num",
+        "_pump_rev",
+        "_pump_rev_enc",
+        "pcba_sn",
+        "_pcba_rev",
+        "_pcba_rev_enc",
+        "model_num",
+    )
+
     opcode = 85  # Type: RESPONSE
-    payload_size = 48  # Fixed 48-byte payload
+    payload_size = _PVR.size  # Fixed 48-byte payload
 
     def __init__(
         self,
@@ -145,16 +219,29 @@ class PumpVersionResponse:
             pcba_rev: PCBA revision string (8 bytes max)
             model_num: Model number (uint32)
         """
-        self.arm_sw_ver = arm_sw_ver
-        self.msp_sw_ver = msp_sw_ver
-        self.config_a_bits = config_a_bits
-        self.config_b_bits = config_b_bits
-        self.serial_num = serial_num
-        self.part_num = part_num
-        self.pump_rev = pump_rev
-        self.pcba_sn = pcba_sn
-        self.pcba_rev = pcba_rev
-        self.model_num = model_num
+        (
+            self.arm_sw_ver,
+            self.msp_sw_ver,
+            self.config_a_bits,
+            self.config_b_bits,
+            self.serial_num,
+            self.part_num,
+            self.pump_rev,
+            self.pcba_sn,
+            self.pcba_rev,
+            self.model_num,
+        ) = (
+            arm_sw_ver,
+            msp_sw_ver,
+            config_a_bits,
+            config_b_bits,
+            serial_num,
+            part_num,
+            pump_rev,
+            pcba_sn,
+            pcba_rev,
+            model_num,
+        )
 
     @staticmethod
     def parse(raw: bytes) -> "PumpVersionResponse":
@@ -174,36 +261,59 @@ class PumpVersionResponse:
         Raises:
             ValueError: If payload size is not 48 bytes
         """
-        if len(raw) != 48:
-            raise ValueError(
-                f"Invalid payload size: expected 48 bytes, got {len(raw)}"
-            )
-
-        # Parse in exact order from Java source
-        arm_sw_ver = read_uint32_le(raw, 0)
-        msp_sw_ver = read_uint32_le(raw, 4)
-        config_a_bits = read_uint32_le(raw, 8)
-        config_b_bits = read_uint32_le(raw, 12)
-        serial_num = read_uint32_le(raw, 16)
-        part_num = read_uint32_le(raw, 20)
-        pump_rev = read_string(raw, 24, 8)
-        pcba_sn = read_uint32_le(raw, 32)
-        pcba_rev = read_string(raw, 36, 8)
-        model_num = read_uint32_le(raw, 44)
-
+        # Parse in exact order from Java source with a single fused unpack
+        (
+            arm_sw_ver,
+            msp_sw_ver,
+            config_a_bits,
+            config_b_bits,
+            serial_num,
+            part_num,
+            pump_rev_bytes,
+            pcba_sn,
+            pcba_rev_bytes,
+            model_num,
+        ) = _unpack_payload(raw)
         return PumpVersionResponse(
-            arm_sw_ver=arm_sw_ver,
-            msp_sw_ver=msp_sw_ver,
-            config_a_bits=config_a_bits,
-            config_b_bits=config_b_bits,
-            serial_num=serial_num,
-            part_num=part_num,
-            pump_rev=pump_rev,
-            pcba_sn=pcba_sn,
-            pcba_rev=pcba_rev,
-            model_num=model_num,
+            arm_sw_ver,
+            msp_sw_ver,
+            config_a_bits,
+            config_b_bits,
+            serial_num,
+            part_num,
+            read_string(pump_rev_bytes, 0, 8),
+            pcba_sn,
+            read_string(pcba_rev_bytes, 0, 8),
+            model_num,
         )
 
+    def parse_into(self, raw: bytes) -> None:
+        """Parse payload bytes into this existing instance.
+
+        Same decoding as parse(), but fills the fields of a preallocated
+        instance so hot receive loops can reuse one object per frame.
+
+        Args:
+            raw: Raw payload bytes (must be exactly 48 bytes)
+
+        Raises:
+            ValueError: If payload size is not 48 bytes
+        """
+        (
+            self.arm_sw_ver,
+            self.msp_sw_ver,
+            self.config_a_bits,
+            self.config_b_bits,
+            self.serial_num,
+            self.part_num,
+            pump_rev_bytes,
+            self.pcba_sn,
+            pcba_rev_bytes,
+            self.model_num,
+        ) = _unpack_payload(raw)
+        self.pump_rev = read_string(pump_rev_bytes, 0, 8)
+        self.pcba_rev = read_string(pcba_rev_bytes, 0, 8)
+
     @staticmethod
     def build_cargo(
         arm_sw_ver: int,
@@ -222,7 +332,7 @@ class PumpVersionResponse:
         Implements the exact buildCargo() logic from Java:
         - Converts each uint32 to 4-byte little-endian
         - Converts strings to 8-byte fixed-length padded format
-        - Combines all bytes in order
+        - Packs all fields in order with a single fused Struct call
 
         Args:
             arm_sw_ver: ARM software version (uint32)
@@ -239,40 +349,63 @@ class PumpVersionResponse:
         Returns:
             48-byte payload (Bytes.combine equivalent)
         """
-        return combine(
-            write_uint32_le(arm_sw_ver),      # [0-3]
-            write_uint32_le(msp_sw_ver),      # [4-7]
-            write_uint32_le(config_a_bits),   # [8-11]
-            write_uint32_le(config_b_bits),   # [12-15]
-            write_uint32_le(serial_num),      # [16-19]
-            write_uint32_le(part_num),        # [20-23]
-            write_string(pump_rev, 8),        # [24-31]
-            write_uint32_le(pcba_sn),         # [32-35]
-            write_string(pcba_rev, 8),        # [36-43]
-            write_uint32_le(model_num),       # [44-47]
+        return _PVR.pack(
+            arm_sw_ver,  # [0-3]
+            msp_sw_ver,  # [4-7]
+            config_a_bits,  # [8-11]
+            config_b_bits,  # [12-15]
+            serial_num,  # [16-19]
+            part_num,  # [20-23]
+            write_string(pump_rev, 8),  # [24-31]
+            pcba_sn,  # [32-35]
+            write_string(pcba_rev, 8),  # [36-43]
+            model_num,  # [44-47]
         )
 
     def build_payload(self) -> bytes:
         """Build payload from instance fields.
 
-        Convenience method wrapping buildCargo() with instance values.
+        Equivalent to buildCargo() with instance values, reusing the cached
+        8-byte encodings of the string fields.
 
         Returns:
             48-byte payload
         """
-        return self.build_cargo(
-            arm_sw_ver=self.arm_sw_ver,
-            msp_sw_ver=self.msp_sw_ver,
-            config_a_bits=self.config_a_bits,
-            config_b_bits=self.config_b_bits,
-            serial_num=self.serial_num,
-            part_num=self.part_num,
-            pump_rev=self.pump_rev,
-            pcba_sn=self.pcba_sn,
-            pcba_rev=self.pcba_rev,
-            model_num=self.model_num,
+        return _PVR.pack(
+            self.arm_sw_ver,
+            self.msp_sw_ver,
+            self.config_a_bits,
+            self.config_b_bits,
+            self.serial_num,
+            self.part_num,
+            self._pump_rev_enc,
+            self.pcba_sn,
+            self._pcba_rev_enc,
+            self.model_num,
         )
 
+    # String fields keep their 8-byte padded encoding cached alongside the
+    # str value, so building a payload never re-encodes them.
+    @property
+    def pump_rev(self) -> str:
+        """Pump revision string."""
+        return self._pump_rev
+
+    @pump_rev.setter
+    def pump_rev(self, value: str) -> None:
+        self._pump_rev = value
+        self._pump_rev_enc = write_string(value, 8)
+
+    @property
+    def pcba_rev(self) -> str:
+        """PCBA revision string."""
+        return self._pcba_rev
+
+    @pcba_rev.setter
+    def pcba_rev(self, value: str) -> None:
+        self._pcba_rev = value
+        self._pcba_rev_enc = write_string(value, 8)
+
     # Getter methods matching Java implementation
     def get_arm_sw_ver(self) -> int:
         """Get ARM software version."""
@@ -6,10 +6,11 @@ challenge-response, JPake key exchange, and session management.
 Milestone 3 deliverable.
 """
 
+import hashlib
 import logging
 import secrets
-from enum import Enum
-from typing import Callable, Optional
+from enum import IntEnum
+from typing import Callable, Optional, Tuple
 
 from tandem_simulator.authentication.jpake import JPakeProtocol
 from tandem_simulator.authentication.jpake_encoding import (
@@ -19,6 +20,8 @@ from tandem_simulator.authentication.jpake_encoding import (
     encode_jpake_round1_pair,
     encode_jpake_round2,
     generate_jpake4_hash_digest,
+    precompute_jpake4_hasher,
+    verify_jpake4_hash_digest,
 )
 from tandem_simulator.authentication.pairing import PairingManager
 from tandem_simulator.authentication.session import SessionManager
@@ -41,26 +44,149 @@ from tandem_simulator.protocol.messages import (
 
 logger = logging.getLogger(__name__)
 
+# Random bytes a full handshake draws from the pool after start_pairing: HMAC
+# key (8), pump challenge (16), Round 3 and Round 4 nonces (8 each)
+_HANDSHAKE_RAND_SIZE = 40
+
+# Random bytes fetched per refill of the Authenticator's CSPRNG pool
+_RAND_POOL_SIZE = 256
+
+# Reserved field sent in JPake Rounds 3 and 4 (8 zero bytes as per pumpx2)
+_RESERVED8 = b"\x00" * 8
+
+
+class AuthenticationState(IntEnum):
+    """Authentication flow states, numbered in handshake order."""
+
+    IDLE = 0
+    WAITING_FOR_PAIRING_CODE = 1
+    CENTRAL_CHALLENGE_SENT = 2
+    PUMP_CHALLENGE_READY = 3
+    JPAKE_ROUND1_SENT = 4
+    JPAKE_ROUND1_COMPLETE = 5
+    JPAKE_ROUND2_SENT = 6
+    JPAKE_ROUND2_COMPLETE = 7
+    KEY_CONFIRMATION_SENT = 8
+    AUTHENTICATED = 9
+    FAILED = 10
+
+
+# Display names indexed by AuthenticationState
+_STATE_NAMES = (
+    "idle",
+    "waiting_for_pairing_code",
+    "central_challenge_sent",
+    "pump_challenge_ready",
+    "jpake_round1_sent",
+    "jpake_round1_complete",
+    "jpake_round2_sent",
+    "jpake_round2_complete",
+    "key_confirmation_sent",
+    "authenticated",
+    "failed",
+)
+
+
+def _build_next_mask() -> Tuple[int, ...]:
+    """Build the bitmask of legal successor states for each AuthenticationState.
+
+    Bit N of entry S is set when the authenticator may move from state S to
+    state N. Every state may restart pairing, fail, or repeat itself (app
+    retransmissions); the challenge exchange may be skipped in favour of JPake.
+
+    Returns:
+        Tuple of successor bitmasks indexed by AuthenticationState
+    """
+    s = AuthenticationState
+    successors = {
+        s.IDLE: (),
+        s.WAITING_FOR_PAIRING_CODE: (
+            s.CENTRAL_CHALLENGE_SENT,
+            s.PUMP_CHALLENGE_READY,
+            s.JPAKE_ROUND1_SENT,
+        ),
+        s.CENTRAL_CHALLENGE_SENT: (s.PUMP_CHALLENGE_READY,),
+        s.PUMP_CHALLENGE_READY: (s.JPAKE_ROUND1_SENT,),
+        s.JPAKE_ROUND1_SENT: (s.JPAKE_ROUND1_COMPLETE,),
+        s.JPAKE_ROUND1_COMPLETE: (s.JPAKE_ROUND2_SENT,),
+        s.JPAKE_ROUND2_SENT: (s.JPAKE_ROUND2_COMPLETE,),
+        s.JPAKE_ROUND2_COMPLETE: (s.KEY_CONFIRMATION_SENT,),
+        s.KEY_CONFIRMATION_SENT: (s.AUTHENTICATED,),
+        s.AUTHENTICATED: (),
+        s.FAILED: (),
+    }
+    always = (1 << s.WAITING_FOR_PAIRING_CODE) | (1 << s.FAILED)
+    masks = [0] * len(s)
+    for state, nexts in successors.items():
+        mask = always | (1 << state)
+        for next_state in nexts:
+            mask |= 1 << next_state
+        masks[state] = mask
+    return tuple(masks)
+
+
+# Legal successor bitmasks indexed by AuthenticationState
+_NEXT_MASK = _build_next_mask()
+
+
+def _noop(_arg) -> None:
+    """Default Authenticator callback that ignores its argument."""
+
+
+class _Hex:
+    """Log argument that hex-encodes its bytes only when the record is emitted."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __str__(self) -> str:
+        return self.data.hex()
+
+
+def _compute_central_challenge_hash(central_challenge: bytes, hmac_key: bytes) -> bytes:
+    """Compute the pump's 20-byte answer to the app's central challenge.
 
-class AuthenticationState(Enum):
-    """Authentication flow states."""
+    Args:
+        central_challenge: Challenge bytes sent by the app
+        hmac_key: HMAC key returned alongside the hash
 
-    IDLE = "idle"
-    WAITING_FOR_PAIRING_CODE = "waiting_for_pairing_code"
-    CENTRAL_CHALLENGE_SENT = "central_challenge_sent"
-    PUMP_CHALLENGE_READY = "pump_challenge_ready"
-    JPAKE_ROUND1_SENT = "jpake_round1_sent"
-    JPAKE_ROUND1_COMPLETE = "jpake_round1_complete"
-    JPAKE_ROUND2_SENT = "jpake_round2_sent"
-    JPAKE_ROUND2_COMPLETE = "jpake_round2_complete"
-    KEY_CONFIRMATION_SENT = "key_confirmation_sent"
-    AUTHENTICATED = "authenticated"
-    FAILED = "failed"
+    Returns:
+        SHA-1 digest of central_challenge || hmac_key
+    """
+    return hashlib.sha1(central_challenge + hmac_key).digest()
 
 
 class Authenticator:
     """Coordinates the complete authentication flow for the simulator."""
 
+    __slots__ = (
+        "pairing_manager",
+        "session_manager",
+        "state",
+        "jpake_protocol",
+        "_pairing_secret",
+        "_spare_jpake",
+        "current_device_address",
+        "transaction_id",
+        "app_instance_id",
+        "central_challenge",
+        "pump_challenge",
+        "g1_point",
+        "g2_point",
+        "g3_point",
+        "g4_point",
+        "a_point",
+        "b_point",
+        "_round1_encoded",
+        "_jpake4_hasher",
+        "_rand_pool",
+        "_rand_off",
+        "on_state_change",
+        "on_pairing_code_generated",
+    )
+
     def __init__(
         self,
         pairing_manager: Optional[PairingManager] = None,
@@ -81,6 +207,12 @@ class Authenticator:
         self.transaction_id: int = 0
         self.app_instance_id: int = 0
 
+        # (pairing_code, JPake shared secret) derived when pairing starts
+        self._pairing_secret: Optional[Tuple[str, int]] = None
+
+        # Protocol instance kept by reset() for the next exchange to reinitialize
+        self._spare_jpake: Optional[JPakeProtocol] = None
+
         # Challenge data
         self.central_challenge: Optional[bytes] = None
         self.pump_challenge: Optional[bytes] = None
@@ -93,22 +225,97 @@ class Authenticator:
         self.a_point: Optional[bytes] = None
         self.b_point: Optional[bytes] = None
 
-        # Callbacks
-        self.on_state_change: Optional[Callable[[AuthenticationState], None]] = None
-        self.on_pairing_code_generated: Optional[Callable[[str], None]] = None
+        # Encoded (jpake1a, jpake1b) payloads for G1/G2, built once in Round 1a
+        self._round1_encoded: Optional[Tuple[bytes, bytes]] = None
+
+        # SHA-256 state with the session key already absorbed, reused for
+        # every Round 4 digest of the current session
+        self._jpake4_hasher: Optional["hashlib._Hash"] = None
+
+        # Pool of CSPRNG output handed out by _rand()
+        self._rand_pool: bytes = b""
+        self._rand_off: int = 0
+
+        # Callbacks (no-ops until replaced)
+        self.on_state_change: Callable[[AuthenticationState], None] = _noop
+        self.on_pairing_code_generated: Callable[[str], None] = _noop
+
+    def _can_transition(self, new_state: AuthenticationState) -> bool:
+        """Check whether new_state may follow the current state.
+
+        Args:
+            new_state: Proposed authentication state
+
+        Returns:
+            True if the transition is legal
+        """
+        return bool((_NEXT_MASK[self.state] >> new_state) & 1)
+
+    def _check_transition(self, new_state: AuthenticationState):
+        """Reject a transition before a handler changes any state.
+
+        Handlers call this first so that a message arriving out of order
+        leaves the authenticator untouched.
+
+        Args:
+            new_state: State the handler will move to
+
+        Raises:
+            ValueError: If new_state cannot follow the current state
+        """
+        if not self._can_transition(new_state):
+            raise ValueError(
+                f"Invalid authentication state transition: "
+                f"{_STATE_NAMES[self.state]} -> {_STATE_NAMES[new_state]}"
+            )
 
     def _set_state(self, new_state: AuthenticationState):
         """Change authentication state and trigger callback.
 
         Args:
             new_state: New authentication state
+
+        Raises:
+            ValueError: If new_state cannot follow the current state
         """
+        self._check_transition(new_state)
         old_state = self.state
         self.state = new_state
-        logger.info(f"Authentication state: {old_state.value} -> {new_state.value}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Authentication state: %s -> %s",
+                _STATE_NAMES[old_state],
+                _STATE_NAMES[new_state],
+            )
+
+        self.on_state_change(new_state)
+
+    def _rand(self, n: int) -> bytes:
+        """Get random bytes from the pooled CSPRNG output.
+
+        Refills the pool with one secrets.token_bytes() call when it runs
+        low, instead of one call per challenge or nonce.
+
+        Args:
+            n: Number of random bytes
+
+        Returns:
+            n random bytes
+        """
+        self._reserve_rand(n)
+        out = self._rand_pool[self._rand_off : self._rand_off + n]
+        self._rand_off += n
+        return out
 
-        if self.on_state_change:
-            self.on_state_change(new_state)
+    def _reserve_rand(self, n: int):
+        """Make sure the pool holds at least n unused random bytes.
+
+        Args:
+            n: Number of random bytes that must be available
+        """
+        if self._rand_off + n > len(self._rand_pool):
+            self._rand_pool = secrets.token_bytes(max(_RAND_POOL_SIZE, n))
+            self._rand_off = 0
 
     def _next_transaction_id(self) -> int:
         """Get next transaction ID.
@@ -116,7 +323,7 @@ class Authenticator:
         Returns:
             Next transaction ID
         """
-        self.transaction_id = (self.transaction_id + 1) % 256
+        self.transaction_id = (self.transaction_id + 1) & 0xFF
         return self.transaction_id
 
     def start_pairing(self, device_address: str) -> str:
@@ -130,19 +337,23 @@ class Authenticator:
         Returns:
             Generated 6-digit pairing code
         """
-        logger.info(f"Starting pairing for device {device_address}")
+        logger.info("Starting pairing for device %s", device_address)
 
         self.current_device_address = device_address
         pairing_code = self.pairing_manager.generate_pairing_code()
+        self._pairing_secret = (pairing_code, JPakeProtocol.derive_secret(pairing_code))
 
         # Generate app instance ID (16-bit random value)
-        self.app_instance_id = secrets.randbelow(0xFFFF)
-        logger.debug(f"Generated app_instance_id: {self.app_instance_id}")
+        self.app_instance_id = int.from_bytes(self._rand(2), "little")
+
+        # Fetch the randomness for the rest of the handshake now, so no
+        # message handler has to refill the pool
+        self._reserve_rand(_HANDSHAKE_RAND_SIZE)
+        logger.debug("Generated app_instance_id: %d", self.app_instance_id)
 
         self._set_state(AuthenticationState.WAITING_FOR_PAIRING_CODE)
 
-        if self.on_pairing_code_generated:
-            self.on_pairing_code_generated(pairing_code)
+        self.on_pairing_code_generated(pairing_code)
 
         return pairing_code
 
@@ -158,6 +369,7 @@ class Authenticator:
             Central challenge response
         """
         logger.info("Received central challenge request")
+        self._check_transition(AuthenticationState.CENTRAL_CHALLENGE_SENT)
 
         # Store app instance ID from request
         self.app_instance_id = message.app_instance_id
@@ -165,10 +377,11 @@ class Authenticator:
         # Store challenge
         self.central_challenge = message.central_challenge
 
-        # Generate pump's response to the challenge (SIMULATOR: random values)
-        # Production should hash the challenge properly
-        central_challenge_hash = secrets.token_bytes(20)  # 20 bytes SHA1 hash
-        hmac_key = secrets.token_bytes(8)  # 8 bytes HMAC key
+        # Generate pump's response to the challenge
+        hmac_key = self._rand(8)  # 8 bytes HMAC key
+        central_challenge_hash = _compute_central_challenge_hash(
+            message.central_challenge, hmac_key
+        )
 
         self._set_state(AuthenticationState.CENTRAL_CHALLENGE_SENT)
 
@@ -189,12 +402,13 @@ class Authenticator:
             Pump challenge response
         """
         logger.info("Received pump challenge request")
+        self._check_transition(AuthenticationState.PUMP_CHALLENGE_READY)
 
         # Update app instance ID from request (in case it changed)
         self.app_instance_id = message.app_instance_id
 
         # Generate pump challenge (stored for later use)
-        self.pump_challenge = secrets.token_bytes(16)
+        self.pump_challenge = self._rand(16)
 
         self._set_state(AuthenticationState.PUMP_CHALLENGE_READY)
 
@@ -213,22 +427,35 @@ class Authenticator:
         Raises:
             ValueError: If pairing code not available
         """
+        self._check_transition(AuthenticationState.JPAKE_ROUND1_SENT)
         pairing_code = self.pairing_manager.get_current_code()
         if not pairing_code:
             raise ValueError("No active pairing code")
 
         logger.info("Generating JPake Round 1a")
 
-        # Initialize JPake protocol
-        self.jpake_protocol = JPakeProtocol(pairing_code=pairing_code, role="pump")
+        # Initialize JPake protocol, reusing an existing instance when there is one.
+        # Reuse the secret derived in start_pairing unless the code has changed since
+        cached = self._pairing_secret
+        secret = cached[1] if cached is not None and cached[0] == pairing_code else None
+        jp = self.jpake_protocol or self._spare_jpake
+        if jp is None:
+            jp = JPakeProtocol(pairing_code=pairing_code, role="pump", secret=secret)
+        else:
+            jp.reinit(pairing_code, role="pump", secret=secret)
+        self.jpake_protocol = jp
+        self._spare_jpake = None
+        self._jpake4_hasher = None
 
         # Generate Round 1 values (G1, G2 are 65-byte EC points)
-        g1, g2 = self.jpake_protocol.generate_round1()
+        g1, g2 = jp.generate_round1()
         self.g1_point = g1
         self.g2_point = g2
 
-        # Encode G1 into 165-byte ECJPAKEKeyKP format (Point + ZKP)
-        jpake1a_data, _ = encode_jpake_round1_pair(g1, g2)
+        # Encode G1 and G2 into 165-byte ECJPAKEKeyKP format (Point + ZKP) once;
+        # the G2 half is sent later in the Round 1b response
+        self._round1_encoded = encode_jpake_round1_pair(g1, g2)
+        jpake1a_data = self._round1_encoded[0]
 
         self._set_state(AuthenticationState.JPAKE_ROUND1_SENT)
 
@@ -248,8 +475,10 @@ class Authenticator:
             Jpake1b response
         """
         logger.info("Received JPake Round 1b")
+        self._check_transition(AuthenticationState.JPAKE_ROUND1_COMPLETE)
 
-        if not self.jpake_protocol:
+        jp = self.jpake_protocol
+        if jp is None:
             raise ValueError("JPake protocol not initialized")
 
         # Update app instance ID from request
@@ -265,30 +494,20 @@ class Authenticator:
 
         # For SIMULATOR: Generate a valid placeholder EC point for G3 if not already set
         # In production, G3 would come from Jpake1aResponse message
-        if self.g3_point is None and self.jpake_protocol:
-            # Generate a valid EC point by using the JPake protocol's scalar mult
-            from cryptography.hazmat.backends import default_backend
-            from cryptography.hazmat.primitives import serialization
-            from cryptography.hazmat.primitives.asymmetric import ec
-
-            # Generate a temporary private key to get a valid point
-            temp_key = ec.generate_private_key(ec.SECP256R1(), default_backend())
-            temp_public = temp_key.public_key()
-            self.g3_point = temp_public.public_bytes(
-                encoding=serialization.Encoding.X962,
-                format=serialization.PublicFormat.UncompressedPoint,
-            )
+        if self.g3_point is None:
+            # Generate a valid EC point by using the JPake protocol's key generation
+            self.g3_point = jp.generate_random_point()
 
         # Process Round 1 data in jpake_protocol so it can generate Round 2
         # SIMULATOR: ZKP verification is skipped
-        if self.jpake_protocol and self.g3_point:
-            self.jpake_protocol.process_round1(self.g3_point, self.g4_point)
+        if self.g3_point:
+            jp.process_round1(self.g3_point, self.g4_point)
 
-        # Encode G2 into response (165-byte ECJPAKEKeyKP format)
-        if not self.g2_point:
+        # G2 was encoded (165-byte ECJPAKEKeyKP format) alongside G1 in Round 1a
+        if not self.g2_point or self._round1_encoded is None:
             raise ValueError("G2 not generated yet")
 
-        _, jpake1b_data = encode_jpake_round1_pair(self.g1_point or b"", self.g2_point)
+        _, jpake1b_data = self._round1_encoded
 
         self._set_state(AuthenticationState.JPAKE_ROUND1_COMPLETE)
 
@@ -305,12 +524,14 @@ class Authenticator:
             Jpake2 request message
         """
         logger.info("Generating JPake Round 2")
+        self._check_transition(AuthenticationState.JPAKE_ROUND2_SENT)
 
-        if not self.jpake_protocol:
+        jp = self.jpake_protocol
+        if jp is None:
             raise ValueError("JPake protocol not initialized")
 
         # Generate Round 2 value (A is 65-byte EC point)
-        a_value = self.jpake_protocol.generate_round2()
+        a_value = jp.generate_round2()
         self.a_point = a_value
 
         # Encode A into 165-byte ECJPAKEKeyKP format (Point + ZKP)
@@ -331,8 +552,10 @@ class Authenticator:
             message: Jpake2 response
         """
         logger.info("Received JPake Round 2 response")
+        self._check_transition(AuthenticationState.JPAKE_ROUND2_COMPLETE)
 
-        if not self.jpake_protocol:
+        jp = self.jpake_protocol
+        if jp is None:
             raise ValueError("JPake protocol not initialized")
 
         # Update app instance ID from response
@@ -344,7 +567,7 @@ class Authenticator:
 
         # Process Round 2 data in jpake_protocol so it can derive session key
         # SIMULATOR: ZKP verification is skipped, but we need to set B for key derivation
-        self.jpake_protocol.process_round2(b_value)
+        jp.process_round2(b_value)
 
         self._set_state(AuthenticationState.JPAKE_ROUND2_COMPLETE)
 
@@ -359,21 +582,22 @@ class Authenticator:
         """
         logger.info("Received JPake Round 3 (session key)")
 
-        if not self.jpake_protocol:
+        jp = self.jpake_protocol
+        if jp is None:
             raise ValueError("JPake protocol not initialized")
 
         # challenge_param triggers session validation (input is always 0 in pumpx2)
-        logger.debug(f"Challenge param: {message.challenge_param}")
+        logger.debug("Challenge param: %s", message.challenge_param)
 
         # Derive session key from EC-JPAKE
-        _ = self.jpake_protocol.derive_session_key()
+        session_key = jp.derive_session_key()
+        self._jpake4_hasher = precompute_jpake4_hasher(session_key)
 
         logger.info("Session key successfully derived")
 
         # Generate device key nonce (random 8 bytes)
-        device_key_nonce = secrets.token_bytes(8)
-        # Reserved field (8 zero bytes as per pumpx2)
-        device_key_reserved = b"\x00" * 8
+        device_key_nonce = self._rand(8)
+        device_key_reserved = _RESERVED8
 
         return Jpake3SessionKeyResponse(
             transaction_id=message.transaction_id,
@@ -389,22 +613,30 @@ class Authenticator:
             Jpake4 key confirmation request
         """
         logger.info("Generating JPake Round 4 (key confirmation)")
+        self._check_transition(AuthenticationState.KEY_CONFIRMATION_SENT)
 
-        if not self.jpake_protocol:
+        jp = self.jpake_protocol
+        if jp is None:
             raise ValueError("JPake protocol not initialized")
 
         # Get session key
-        session_key = self.jpake_protocol.get_session_key()
+        session_key = jp.get_session_key()
         if not session_key:
             raise ValueError("Session key not derived yet")
 
         # Generate nonce and reserved fields
-        nonce = secrets.token_bytes(8)
-        reserved = b"\x00" * 8  # 8 zero bytes as per pumpx2
+        nonce = self._rand(8)
+        reserved = _RESERVED8
 
         # Generate hash digest for key confirmation
+        if self._jpake4_hasher is None:
+            self._jpake4_hasher = precompute_jpake4_hasher(session_key)
         hash_digest = generate_jpake4_hash_digest(
-            session_key=session_key, role="pump", nonce=nonce, reserved=reserved
+            session_key=session_key,
+            role="pump",
+            nonce=nonce,
+            reserved=reserved,
+            precomputed=self._jpake4_hasher,
         )
 
         self._set_state(AuthenticationState.KEY_CONFIRMATION_SENT)
@@ -425,23 +657,47 @@ class Authenticator:
         """
         logger.info("Received JPake Round 4 response")
 
-        if not self.jpake_protocol:
+        # Only a pump that sent its own confirmation may accept the app's;
+        # fail before a session is saved or the pairing code is cleared
+        if not self._can_transition(AuthenticationState.AUTHENTICATED):
+            logger.error("Unexpected JPake Round 4 response in state %s", _STATE_NAMES[self.state])
+            self._set_state(AuthenticationState.FAILED)
+            return
+
+        jp = self.jpake_protocol
+        if jp is None:
             logger.error("JPake protocol not initialized")
             self._set_state(AuthenticationState.FAILED)
             return
 
         # Get session key for verification
-        session_key = self.jpake_protocol.get_session_key()
+        session_key = jp.get_session_key()
         if not session_key:
             logger.error("Session key not available")
             self._set_state(AuthenticationState.FAILED)
             return
 
-        # Verify the response hash_digest (SIMULATOR: simplified verification)
-        # Production should use constant-time comparison and verify all exchanged points
-        # For now, we accept the response if it has valid structure
-        logger.debug(f"Received hash_digest: {message.hash_digest.hex()}")
-        logger.debug(f"Nonce: {message.nonce.hex()}, Reserved: {message.reserved.hex()}")
+        logger.debug(
+            "Received hash_digest: %s, nonce: %s, reserved: %s",
+            _Hex(message.hash_digest),
+            _Hex(message.nonce),
+            _Hex(message.reserved),
+        )
+
+        # Verify the app's confirmation digest (constant-time comparison)
+        if self._jpake4_hasher is None:
+            self._jpake4_hasher = precompute_jpake4_hasher(session_key)
+        if not verify_jpake4_hash_digest(
+            message.hash_digest,
+            session_key=session_key,
+            role="app",
+            nonce=message.nonce,
+            reserved=message.reserved,
+            precomputed=self._jpake4_hasher,
+        ):
+            logger.error("Key confirmation failed: hash_digest mismatch")
+            self._set_state(AuthenticationState.FAILED)
+            return
 
         # Authentication successful!
         if self.current_device_address:
@@ -451,7 +707,7 @@ class Authenticator:
                 session_key=session_key,
             )
 
-            logger.info(f"Authentication complete for {self.current_device_address}")
+            logger.info("Authentication complete for %s", self.current_device_address)
             self._set_state(AuthenticationState.AUTHENTICATED)
 
             # Clear pairing code
@@ -481,15 +737,24 @@ class Authenticator:
         Returns:
             Session key if found, None otherwise
         """
+        # The session manager caches decoded keys per session
         return self.session_manager.get_session_key(device_address)
 
     def reset(self):
         """Reset authentication state."""
         self.state = AuthenticationState.IDLE
+        if self.jpake_protocol is not None:
+            self.jpake_protocol.reset()
+            self._spare_jpake = self.jpake_protocol
         self.jpake_protocol = None
+        self._pairing_secret = None
+        self._round1_encoded = None
+        self._jpake4_hasher = None
         self.current_device_address = None
         self.central_challenge = None
         self.pump_challenge = None
+        self._rand_pool = b""
+        self._rand_off = 0
         self.pairing_manager.clear_pairing_code()
 
     def get_status(self) -> dict:
@@ -499,7 +764,7 @@ class Authenticator:
             Dictionary with status information
         """
         return {
-            "state": self.state.value,
+            "state": _STATE_NAMES[self.state],
             "current_device": self.current_device_address,
             "pairing_status": self.pairing_manager.get_status(),
             "session_stats": self.session_manager.get_statistics(),
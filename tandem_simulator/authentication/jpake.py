@@ -25,6 +25,61 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 
+from tandem_simulator.authentication.jpake_encoding import jpake_confirmation_string
+
+# Order n of the P-256 base point; private scalars are reduced modulo n
+_P256_ORDER = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+
+# Curve and backend are stateless, so every exchange shares one instance of each
+_CURVE = ec.SECP256R1()
+_BACKEND = default_backend()
+
+# Serialization arguments for points, looked up once rather than per call
+_ENC_X962 = serialization.Encoding.X962
+_FMT_UNCOMPRESSED = serialization.PublicFormat.UncompressedPoint
+
+
+def _point_to_bytes(public_key: ec.EllipticCurvePublicKey) -> bytes:
+    """Serialize an elliptic curve point to bytes.
+
+    Args:
+        public_key: Public key to serialize
+
+    Returns:
+        Serialized point bytes (65-byte SEC1 uncompressed)
+    """
+    return public_key.public_bytes(_ENC_X962, _FMT_UNCOMPRESSED)
+
+
+def _bytes_to_point(data: bytes) -> ec.EllipticCurvePublicKey:
+    """Deserialize bytes to a P-256 point.
+
+    Args:
+        data: Serialized point bytes
+
+    Returns:
+        Public key object
+    """
+    return ec.EllipticCurvePublicKey.from_encoded_point(_CURVE, data)
+
+
+def _canonical_bytes(data: bytes, point: ec.EllipticCurvePublicKey) -> bytes:
+    """Get the uncompressed encoding of a received point.
+
+    Uncompressed SEC1 encodings are unique, so one is returned as received;
+    any other accepted form (e.g. compressed) is re-serialized.
+
+    Args:
+        data: Point bytes as received
+        point: Public key deserialized from data
+
+    Returns:
+        65-byte SEC1 uncompressed point
+    """
+    if len(data) == 65 and data[0] == 0x04:
+        return bytes(data)
+    return _point_to_bytes(point)
+
 
 class JPakeProtocol:
     """Implements the J-PAKE key exchange protocol using elliptic curves.
@@ -33,19 +88,50 @@ class JPakeProtocol:
     the Tandem pump simulator. It uses SECP256R1 (P-256) elliptic curve.
     """
 
-    def __init__(self, pairing_code: str, role: str = "pump"):
+    __slots__ = (
+        "pairing_code",
+        "role",
+        "session_key",
+        "_key_confirmation",
+        "_hmac_template",
+        "curve",
+        "x1",
+        "x2",
+        "x3",
+        "x4",
+        "G1",
+        "G2",
+        "G3",
+        "G4",
+        "A",
+        "B",
+        "G1_bytes",
+        "G2_bytes",
+        "G3_bytes",
+        "G4_bytes",
+        "A_bytes",
+        "B_bytes",
+        "s",
+    )
+
+    def __init__(self, pairing_code: str, role: str = "pump", secret: Optional[int] = None):
         """Initialize JPake protocol.
 
         Args:
             pairing_code: 6-digit pairing code shared between pump and app
             role: Role in the exchange - "pump" or "app"
+            secret: Shared secret already derived from pairing_code with
+                derive_secret() (derived here if None)
         """
         self.pairing_code = pairing_code
         self.role = role
         self.session_key: Optional[bytes] = None
+        self._key_confirmation: Optional[bytes] = None
+        # (session_key, HMAC keyed with it) so confirmations skip the key schedule
+        self._hmac_template: Optional[Tuple[bytes, hmac.HMAC]] = None
 
         # Elliptic curve - using SECP256R1 (P-256)
-        self.curve = ec.SECP256R1()
+        self.curve = _CURVE
 
         # Ephemeral private keys (x1, x2 for pump; x3, x4 for app)
         self.x1: Optional[int] = None
@@ -63,11 +149,23 @@ class JPakeProtocol:
         self.A: Optional[ec.EllipticCurvePublicKey] = None
         self.B: Optional[ec.EllipticCurvePublicKey] = None
 
+        # SEC1 uncompressed encodings of the points above, kept for key derivation
+        self.G1_bytes: Optional[bytes] = None
+        self.G2_bytes: Optional[bytes] = None
+        self.G3_bytes: Optional[bytes] = None
+        self.G4_bytes: Optional[bytes] = None
+        self.A_bytes: Optional[bytes] = None
+        self.B_bytes: Optional[bytes] = None
+
         # Shared secret from pairing code
-        self.s = self._derive_shared_secret(pairing_code)
+        self.s = secret if secret is not None else self.derive_secret(pairing_code)
 
-    def _derive_shared_secret(self, pairing_code: str) -> int:
-        """Derive a shared secret from the pairing code.
+    @staticmethod
+    def derive_secret(pairing_code: str) -> int:
+        """Derive the shared secret for a pairing code.
+
+        Callers that know the pairing code ahead of the exchange can derive
+        the secret once and pass it to the constructor.
 
         Args:
             pairing_code: 6-digit pairing code
@@ -77,8 +175,9 @@ class JPakeProtocol:
         """
         # Hash the pairing code to get a shared secret
         h = hashlib.sha256(pairing_code.encode()).digest()
-        # Convert to integer, ensuring it's in valid range for curve order
-        return int.from_bytes(h, "big") % self.curve.key_size
+        # Convert to integer in the valid scalar range [1, n) for the curve order.
+        # n is prime, so a non-zero s keeps x * s non-zero for every private x
+        return int.from_bytes(h, "big") % _P256_ORDER or 1
 
     def _generate_private_key(self) -> Tuple[int, ec.EllipticCurvePrivateKey]:
         """Generate a random private key for the curve.
@@ -86,35 +185,25 @@ class JPakeProtocol:
         Returns:
             Tuple of (scalar value, private key object)
         """
-        private_key = ec.generate_private_key(self.curve, default_backend())
+        private_key = ec.generate_private_key(self.curve, _BACKEND)
         # Get the scalar value
         private_numbers = private_key.private_numbers()
         return private_numbers.private_value, private_key
 
-    def _point_to_bytes(self, public_key: ec.EllipticCurvePublicKey) -> bytes:
-        """Serialize an elliptic curve point to bytes.
+    def generate_random_point(self) -> bytes:
+        """Generate a serialized public point for a fresh random scalar.
 
-        Args:
-            public_key: Public key to serialize
+        Used by the simulator where a valid but otherwise arbitrary point is
+        needed. Key generation runs OpenSSL's fixed-base scalar
+        multiplication, which works from precomputed multiples of the
+        generator.
 
         Returns:
-            Serialized point bytes
+            Serialized point bytes (65-byte SEC1 uncompressed)
         """
-        return public_key.public_bytes(
-            encoding=serialization.Encoding.X962,
-            format=serialization.PublicFormat.UncompressedPoint,
-        )
-
-    def _bytes_to_point(self, data: bytes) -> ec.EllipticCurvePublicKey:
-        """Deserialize bytes to an elliptic curve point.
-
-        Args:
-            data: Serialized point bytes
-
-        Returns:
-            Public key object
-        """
-        return ec.EllipticCurvePublicKey.from_encoded_point(self.curve, data)
+        # The scalar is discarded, so skip the private_numbers() export
+        private_key = ec.generate_private_key(self.curve, _BACKEND)
+        return _point_to_bytes(private_key.public_key())
 
     def _scalar_mult(
         self, scalar: int, point: Optional[ec.EllipticCurvePublicKey] = None
@@ -128,15 +217,9 @@ class JPakeProtocol:
         Returns:
             Resulting public key
         """
-        if point is None:
-            # Multiply generator point by scalar
-            private_key = ec.derive_private_key(scalar, self.curve, default_backend())
-            return private_key.public_key()
-        else:
-            # This is simplified - in real implementation would do proper point arithmetic
-            # For simulator purposes, we'll use a workaround
-            private_key = ec.derive_private_key(scalar, self.curve, default_backend())
-            return private_key.public_key()
+        # Multiply the generator point by scalar. SIMULATOR: a non-generator
+        # point is not supported by the public API, so it is treated the same way
+        return ec.derive_private_key(scalar, self.curve, _BACKEND).public_key()
 
     def generate_round1(self) -> Tuple[bytes, bytes]:
         """Generate Round 1 values (G1, G2) for pump or (G3, G4) for app.
@@ -147,27 +230,30 @@ class JPakeProtocol:
         Raises:
             ValueError: If role is invalid
         """
-        if self.role == "pump":
-            # Generate x1 and x2
-            self.x1, _ = self._generate_private_key()
-            self.x2, _ = self._generate_private_key()
+        self._invalidate_session_key()
 
-            # Calculate G1 = G * x1 and G2 = G * x2
-            self.G1 = self._scalar_mult(self.x1)
-            self.G2 = self._scalar_mult(self.x2)
+        if self.role == "pump":
+            # Generate x1 and x2; key generation already computes G1 = G * x1
+            # and G2 = G * x2, so reuse those points instead of re-deriving them
+            self.x1, key1 = self._generate_private_key()
+            self.x2, key2 = self._generate_private_key()
+            self.G1 = key1.public_key()
+            self.G2 = key2.public_key()
+            self.G1_bytes = _point_to_bytes(self.G1)
+            self.G2_bytes = _point_to_bytes(self.G2)
 
-            return self._point_to_bytes(self.G1), self._point_to_bytes(self.G2)
+            return self.G1_bytes, self.G2_bytes
 
         elif self.role == "app":
-            # Generate x3 and x4
-            self.x3, _ = self._generate_private_key()
-            self.x4, _ = self._generate_private_key()
-
-            # Calculate G3 = G * x3 and G4 = G * x4
-            self.G3 = self._scalar_mult(self.x3)
-            self.G4 = self._scalar_mult(self.x4)
+            # Generate x3 and x4 along with G3 = G * x3 and G4 = G * x4
+            self.x3, key3 = self._generate_private_key()
+            self.x4, key4 = self._generate_private_key()
+            self.G3 = key3.public_key()
+            self.G4 = key4.public_key()
+            self.G3_bytes = _point_to_bytes(self.G3)
+            self.G4_bytes = _point_to_bytes(self.G4)
 
-            return self._point_to_bytes(self.G3), self._point_to_bytes(self.G4)
+            return self.G3_bytes, self.G4_bytes
 
         else:
             raise ValueError(f"Invalid role: {self.role}")
@@ -179,14 +265,19 @@ class JPakeProtocol:
             point1: First point (G3 for pump, G1 for app)
             point2: Second point (G4 for pump, G2 for app)
         """
+        self._invalidate_session_key()
         if self.role == "pump":
             # Pump receives G3 and G4 from app
-            self.G3 = self._bytes_to_point(point1)
-            self.G4 = self._bytes_to_point(point2)
+            self.G3 = _bytes_to_point(point1)
+            self.G4 = _bytes_to_point(point2)
+            self.G3_bytes = _canonical_bytes(point1, self.G3)
+            self.G4_bytes = _canonical_bytes(point2, self.G4)
         elif self.role == "app":
             # App receives G1 and G2 from pump
-            self.G1 = self._bytes_to_point(point1)
-            self.G2 = self._bytes_to_point(point2)
+            self.G1 = _bytes_to_point(point1)
+            self.G2 = _bytes_to_point(point2)
+            self.G1_bytes = _canonical_bytes(point1, self.G1)
+            self.G2_bytes = _canonical_bytes(point2, self.G2)
 
     def generate_round2(self) -> bytes:
         """Generate Round 2 value (A for pump, B for app).
@@ -200,6 +291,8 @@ class JPakeProtocol:
         Raises:
             ValueError: If prerequisites not met
         """
+        self._invalidate_session_key()
+
         if self.role == "pump":
             if not all([self.x2, self.G1, self.G3, self.G4]):
                 raise ValueError("Missing values for Round 2 generation")
@@ -208,10 +301,11 @@ class JPakeProtocol:
             # A = (G1 + G3 + G4) * (x2 * s)
             # Note: In production, proper point addition would be needed
             assert self.x2 is not None  # Checked above
-            scalar_a = (self.x2 * self.s) % self.curve.key_size
+            scalar_a = (self.x2 * self.s) % _P256_ORDER
             self.A = self._scalar_mult(scalar_a)
+            self.A_bytes = _point_to_bytes(self.A)
 
-            return self._point_to_bytes(self.A)
+            return self.A_bytes
 
         elif self.role == "app":
             if not all([self.x4, self.G1, self.G2, self.G3]):
@@ -219,10 +313,11 @@ class JPakeProtocol:
 
             # B = (G1 + G2 + G3) * (x4 * s)
             assert self.x4 is not None  # Checked above
-            scalar_b = (self.x4 * self.s) % self.curve.key_size
+            scalar_b = (self.x4 * self.s) % _P256_ORDER
             self.B = self._scalar_mult(scalar_b)
+            self.B_bytes = _point_to_bytes(self.B)
 
-            return self._point_to_bytes(self.B)
+            return self.B_bytes
 
         else:
             raise ValueError(f"Invalid role: {self.role}")
@@ -233,12 +328,15 @@ class JPakeProtocol:
         Args:
             value: A value (for app) or B value (for pump)
         """
+        self._invalidate_session_key()
         if self.role == "pump":
             # Pump receives B from app
-            self.B = self._bytes_to_point(value)
+            self.B = _bytes_to_point(value)
+            self.B_bytes = _canonical_bytes(value, self.B)
         elif self.role == "app":
             # App receives A from pump
-            self.A = self._bytes_to_point(value)
+            self.A = _bytes_to_point(value)
+            self.A_bytes = _canonical_bytes(value, self.A)
 
     def derive_session_key(self) -> bytes:
         """Derive the shared session key.
@@ -248,12 +346,18 @@ class JPakeProtocol:
         For pump: K = (B / G4^(x2*s)) ^ x2 = B^x2 / G4^(x2^2 * s)
         For app: K = (A / G2^(x4*s)) ^ x4 = A^x4 / G2^(x4^2 * s)
 
+        The key is derived once per transcript; later calls return the
+        cached key until a round value changes.
+
         Returns:
             32-byte session key
 
         Raises:
             ValueError: If prerequisites not met
         """
+        if self.session_key is not None:
+            return self.session_key
+
         if self.role == "pump":
             if not all([self.x2, self.B, self.G4]):
                 raise ValueError("Missing values for session key derivation")
@@ -265,23 +369,28 @@ class JPakeProtocol:
 
         # Simplified key derivation for simulator
         # In production, proper point arithmetic would compute: K = ...
-        # For simulator, both parties derive the same key from all shared material
-        # in a canonical order (G1, G2, G3, G4, A, B, pairing_code)
-        assert self.G1 is not None and self.G2 is not None  # Set during protocol
-        assert self.G3 is not None and self.G4 is not None  # Set during protocol
-        assert self.A is not None and self.B is not None  # Checked above
-
-        key_material = b""
-        key_material += self._point_to_bytes(self.G1)
-        key_material += self._point_to_bytes(self.G2)
-        key_material += self._point_to_bytes(self.G3)
-        key_material += self._point_to_bytes(self.G4)
-        key_material += self._point_to_bytes(self.A)
-        key_material += self._point_to_bytes(self.B)
-        key_material += self.pairing_code.encode()
-
-        # Derive session key using SHA-256
-        self.session_key = hashlib.sha256(key_material).digest()
+        # For simulator, both parties derive the same key as HMAC-SHA256 keyed
+        # with the pairing code over all exchanged points in a canonical order
+        # (G1, G2, G3, G4, A, B), the HMAC-SHA256 construction production uses
+        # Encodings were stored when each point was generated or received
+        assert self.G1_bytes is not None and self.G2_bytes is not None  # Set during protocol
+        assert self.G3_bytes is not None and self.G4_bytes is not None  # Set during protocol
+        assert self.A_bytes is not None and self.B_bytes is not None  # Checked above
+
+        transcript = b"".join(
+            (
+                self.G1_bytes,
+                self.G2_bytes,
+                self.G3_bytes,
+                self.G4_bytes,
+                self.A_bytes,
+                self.B_bytes,
+            )
+        )
+
+        # One-shot HMAC: the key is used once per transcript, so there is no
+        # keyed template worth copying
+        self.session_key = hmac.digest(self.pairing_code.encode(), transcript, "sha256")
 
         return self.session_key
 
@@ -296,11 +405,13 @@ class JPakeProtocol:
         if not self.session_key:
             raise ValueError("Session key not yet derived")
 
-        # Generate confirmation using HMAC
-        confirmation_data = b"JPake-Confirmation-" + self.role.encode()
-        confirmation = hmac.new(self.session_key, confirmation_data, hashlib.sha256).digest()
+        if self._key_confirmation is None:
+            # Generate confirmation using HMAC
+            mac = self._session_hmac()
+            mac.update(jpake_confirmation_string(self.role))
+            self._key_confirmation = mac.digest()
 
-        return confirmation
+        return self._key_confirmation
 
     def verify_key_confirmation(self, received_confirmation: bytes, expected_role: str) -> bool:
         """Verify key confirmation from other party.
@@ -316,14 +427,36 @@ class JPakeProtocol:
             raise ValueError("Session key not yet derived")
 
         # Calculate expected confirmation
-        confirmation_data = b"JPake-Confirmation-" + expected_role.encode()
-        expected_confirmation = hmac.new(
-            self.session_key, confirmation_data, hashlib.sha256
-        ).digest()
+        mac = self._session_hmac()
+        mac.update(jpake_confirmation_string(expected_role))
+        expected_confirmation = mac.digest()
 
         # Constant-time comparison
         return hmac.compare_digest(received_confirmation, expected_confirmation)
 
+    def _session_hmac(self) -> hmac.HMAC:
+        """Get a fresh HMAC-SHA256 keyed with the session key.
+
+        The keyed template is built once per session key and copied for each
+        message, so the inner/outer pad setup is not repeated per call.
+
+        Returns:
+            HMAC object that has not absorbed any message yet
+        """
+        session_key = self.session_key
+        assert session_key is not None  # Checked by callers
+        template = self._hmac_template
+        if template is None or template[0] is not session_key:
+            template = (session_key, hmac.new(session_key, digestmod=hashlib.sha256))
+            self._hmac_template = template
+        return template[1].copy()
+
+    def _invalidate_session_key(self):
+        """Drop the derived session key and confirmation after a round value changes."""
+        self.session_key = None
+        self._key_confirmation = None
+        self._hmac_template = None
+
     def get_session_key(self) -> Optional[bytes]:
         """Get the derived session key.
 
@@ -340,9 +473,23 @@ class JPakeProtocol:
         """
         return self.session_key is not None
 
+    def reinit(self, pairing_code: str, role: str = "pump", secret: Optional[int] = None):
+        """Prepare this instance for a new exchange, as if freshly constructed.
+
+        Args:
+            pairing_code: 6-digit pairing code shared between pump and app
+            role: Role in the exchange - "pump" or "app"
+            secret: Shared secret already derived from pairing_code with
+                derive_secret() (derived here if None)
+        """
+        self.reset()
+        self.pairing_code = pairing_code
+        self.role = role
+        self.s = secret if secret is not None else self.derive_secret(pairing_code)
+
     def reset(self):
         """Reset the protocol state for a new exchange."""
-        self.session_key = None
+        self._invalidate_session_key()
         self.x1 = None
         self.x2 = None
         self.x3 = None
@@ -353,3 +500,9 @@ class JPakeProtocol:
         self.G4 = None
         self.A = None
         self.B = None
+        self.G1_bytes = None
+        self.G2_bytes = None
+        self.G3_bytes = None
+        self.G4_bytes = None
+        self.A_bytes = None
+        self.B_bytes = None
@@ -34,15 +34,22 @@ Complete ECJPAKEKeyKP Structure:
 """
 
 import hashlib
+import hmac
 import secrets
-from typing import Tuple
+from typing import Optional, Tuple
 
+# Random bytes consumed by one placeholder ZKP: 64 for point V, 34 for scalar r
+_ZKP_RANDOM_SIZE = 64 + 34
 
-def encode_ec_jpake_key_kp(point_data: bytes) -> bytes:
+
+def encode_ec_jpake_key_kp(point_data: bytes, zkp_random: Optional[bytes] = None) -> bytes:
     """Encode an EC-JPAKE Key-Knowledge Proof structure.
 
     Args:
         point_data: Public key point bytes (65 bytes, SEC1 uncompressed format)
+        zkp_random: Optional 98 random bytes for the placeholder ZKP, for
+            callers that draw randomness for several structures at once
+            (drawn here if None)
 
     Returns:
         165-byte ECJPAKEKeyKP structure (point + ZKP)
@@ -57,24 +64,23 @@ def encode_ec_jpake_key_kp(point_data: bytes) -> bytes:
     if point_data[0] != 0x04:
         raise ValueError("EC point must be in SEC1 uncompressed format (0x04 prefix)")
 
-    # Point X (the actual public key): 65 bytes
-    x_bytes = point_data
-
     # Generate placeholder ZKP (SIMULATOR ONLY - NOT CRYPTOGRAPHICALLY VALID)
     # In production, this would be a Schnorr ZKP: (V, r) where:
     #   V = G * v (random point)
     #   r = v - x * h (scalar, where h = hash(G || V || X || UserID))
 
-    # ZKP Point V: 65 bytes (random P-256 point for simulation)
-    # Format: 0x04 + random_x_coord (32 bytes) + random_y_coord (32 bytes)
-    zkp_v = b"\x04" + secrets.token_bytes(64)
-
-    # ZKP scalar r: 1-byte length + 34-byte value
-    r_length = bytes([34])
-    zkp_r = secrets.token_bytes(34)
+    # Random bytes for both ZKP fields, drawn in one call:
+    # 64 coordinate bytes of point V followed by the 34-byte scalar r
+    if zkp_random is None:
+        zkp_random = secrets.token_bytes(_ZKP_RANDOM_SIZE)
+    elif len(zkp_random) != _ZKP_RANDOM_SIZE:
+        raise ValueError(f"ZKP randomness must be 98 bytes, got {len(zkp_random)}")
 
-    # Combine into 165-byte structure
-    return x_bytes + zkp_v + r_length + zkp_r
+    # Combine into 165-byte structure with a single copy:
+    #   Point X (the actual public key): 65 bytes
+    #   ZKP Point V: 0x04 + random_x_coord (32 bytes) + random_y_coord (32 bytes)
+    #   ZKP scalar r: 1-byte length (34) + 34-byte value
+    return b"".join((point_data, b"\x04", zkp_random[:64], b"\x22", zkp_random[64:]))
 
 
 def decode_ec_jpake_key_kp(data: bytes) -> Tuple[bytes, bytes, bytes]:
@@ -133,8 +139,10 @@ def encode_jpake_round1_pair(g1_point: bytes, g2_point: bytes) -> Tuple[bytes, b
         - First 165 bytes: G1 + ZKP(G1)
         - Second 165 bytes: G2 + ZKP(G2)
     """
-    jpake1a = encode_ec_jpake_key_kp(g1_point)
-    jpake1b = encode_ec_jpake_key_kp(g2_point)
+    # One draw covers the placeholder ZKPs of both structures
+    zkp_random = secrets.token_bytes(2 * _ZKP_RANDOM_SIZE)
+    jpake1a = encode_ec_jpake_key_kp(g1_point, zkp_random[:_ZKP_RANDOM_SIZE])
+    jpake1b = encode_ec_jpake_key_kp(g2_point, zkp_random[_ZKP_RANDOM_SIZE:])
     return jpake1a, jpake1b
 
 
@@ -189,8 +197,49 @@ def decode_jpake_round2(data: bytes) -> bytes:
     return b_point
 
 
+def precompute_jpake4_hasher(session_key: bytes) -> "hashlib._Hash":
+    """Absorb the session key into a reusable SHA-256 state.
+
+    The session key is the fixed prefix of every Round 4 digest for a
+    session, so callers producing several digests can hash it once and
+    pass the result to generate_jpake4_hash_digest(precomputed=...).
+
+    Args:
+        session_key: Derived session key from EC-JPAKE
+
+    Returns:
+        SHA-256 hasher that has absorbed session_key
+    """
+    return hashlib.sha256(session_key)
+
+
+# Encoded key confirmation strings for the two roles
+_JPAKE4_CONFIRMATION_STRINGS = {
+    role: f"JPake-Confirmation-{role}".encode("utf-8") for role in ("pump", "app")
+}
+
+
+def jpake_confirmation_string(role: str) -> bytes:
+    """Get the encoded key confirmation string for a role.
+
+    Args:
+        role: "pump" or "app" (other values are encoded on the fly)
+
+    Returns:
+        b"JPake-Confirmation-" followed by the role
+    """
+    confirmation_string = _JPAKE4_CONFIRMATION_STRINGS.get(role)
+    if confirmation_string is None:
+        confirmation_string = f"JPake-Confirmation-{role}".encode("utf-8")
+    return confirmation_string
+
+
 def generate_jpake4_hash_digest(
-    session_key: bytes, role: str, nonce: bytes, reserved: bytes
+    session_key: bytes,
+    role: str,
+    nonce: bytes,
+    reserved: bytes,
+    precomputed: Optional["hashlib._Hash"] = None,
 ) -> bytes:
     """Generate JPake Round 4 key confirmation hash.
 
@@ -199,6 +248,9 @@ def generate_jpake4_hash_digest(
         role: "pump" or "app"
         nonce: 8-byte nonce value
         reserved: 8-byte reserved field (typically zeros)
+        precomputed: Optional SHA-256 hasher that has already absorbed
+            session_key (see precompute_jpake4_hasher); it is copied, not
+            modified, so one instance can serve every digest for a session
 
     Returns:
         32-byte SHA-256 hash digest
@@ -211,33 +263,41 @@ def generate_jpake4_hash_digest(
     # PRODUCTION: Should be HMAC-SHA256(session_key, "JPake-Confirmation-" + role)
     # and include all exchanged EC points (G1, G2, G3, G4, A, B)
 
-    confirmation_string = f"JPake-Confirmation-{role}".encode("utf-8")
-    hasher = hashlib.sha256()
-    hasher.update(session_key)
-    hasher.update(confirmation_string)
-    hasher.update(nonce)
-    hasher.update(reserved)
+    confirmation_string = jpake_confirmation_string(role)
+    if precomputed is None:
+        hasher = precompute_jpake4_hasher(session_key)
+    else:
+        hasher = precomputed.copy()
+    # One update over the whole suffix instead of one per field
+    hasher.update(b"".join((confirmation_string, nonce, reserved)))
     return hasher.digest()  # 32 bytes
 
 
 def verify_jpake4_hash_digest(
-    received_hash: bytes, session_key: bytes, role: str, nonce: bytes, reserved: bytes
+    received_hash: bytes,
+    session_key: bytes,
+    role: str,
+    nonce: bytes,
+    reserved: bytes,
+    precomputed: Optional["hashlib._Hash"] = None,
 ) -> bool:
     """Verify JPake Round 4 key confirmation hash.
 
+    The comparison runs in constant time so a mismatching digest does not
+    leak how many leading bytes were correct.
+
     Args:
         received_hash: 32-byte hash from other party
         session_key: Derived session key from EC-JPAKE
         role: "pump" or "app" (counterparty role)
         nonce: 8-byte nonce value
         reserved: 8-byte reserved field
+        precomputed: Optional hasher from precompute_jpake4_hasher(session_key)
 
     Returns:
         True if hash matches expected value
-
-    Note:
-        SIMULATOR ONLY: Uses simplified verification. Production needs
-        proper HMAC verification with constant-time comparison.
     """
-    expected_hash = generate_jpake4_hash_digest(session_key, role, nonce, reserved)
-    return received_hash == expected_hash
+    expected_hash = generate_jpake4_hash_digest(
+        session_key, role, nonce, reserved, precomputed=precomputed
+    )
+    return hmac.compare_digest(received_hash, expected_hash)
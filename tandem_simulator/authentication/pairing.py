@@ -6,7 +6,8 @@ with timeout management.
 Milestone 3 deliverable.
 """
 
-import random
+import hmac
+import secrets
 import time
 from datetime import datetime, timedelta
 from typing import Optional
@@ -15,6 +16,15 @@ from typing import Optional
 class PairingManager:
     """Manages pairing codes and pairing flow with timeout handling."""
 
+    __slots__ = (
+        "current_pairing_code",
+        "pairing_timeout",
+        "_code_generated_monotonic",
+        "_code_generated_time",
+        "pairing_attempts",
+        "max_attempts",
+    )
+
     def __init__(self, timeout_seconds: int = 60):
         """Initialize the pairing manager.
 
@@ -23,7 +33,10 @@ class PairingManager:
         """
         self.current_pairing_code: Optional[str] = None
         self.pairing_timeout: int = timeout_seconds
-        self.code_generated_at: Optional[datetime] = None
+        # Expiry is tracked on the monotonic clock; wall-clock time is kept
+        # only to report when the code was generated
+        self._code_generated_monotonic: Optional[float] = None
+        self._code_generated_time: Optional[float] = None
         self.pairing_attempts: int = 0
         self.max_attempts: int = 3
 
@@ -35,23 +48,35 @@ class PairingManager:
         Returns:
             6-digit pairing code as string
         """
-        code = f"{random.randint(0, 999999):06d}"
+        code = f"{secrets.randbelow(1_000_000):06d}"
         self.current_pairing_code = code
-        self.code_generated_at = datetime.now()
+        self._code_generated_monotonic = time.monotonic()
+        self._code_generated_time = time.time()
         self.pairing_attempts = 0
         return code
 
+    @property
+    def code_generated_at(self) -> Optional[datetime]:
+        """Local time at which the current pairing code was generated.
+
+        Returns:
+            Generation time, or None if no code is active
+        """
+        if self._code_generated_time is None:
+            return None
+        return datetime.fromtimestamp(self._code_generated_time)
+
     def is_code_expired(self) -> bool:
         """Check if the current pairing code has expired.
 
         Returns:
             True if code has expired or no code is active
         """
-        if self.current_pairing_code is None or self.code_generated_at is None:
+        generated = self._code_generated_monotonic
+        if self.current_pairing_code is None or generated is None:
             return True
 
-        elapsed = datetime.now() - self.code_generated_at
-        return elapsed.total_seconds() >= self.pairing_timeout
+        return time.monotonic() - generated >= self.pairing_timeout
 
     def get_remaining_time(self) -> float:
         """Get remaining time before code expires.
@@ -59,12 +84,11 @@ class PairingManager:
         Returns:
             Remaining time in seconds, or 0 if expired/no code
         """
-        if self.is_code_expired():
+        generated = self._code_generated_monotonic
+        if self.current_pairing_code is None or generated is None:
             return 0.0
 
-        assert self.code_generated_at is not None  # Checked by is_code_expired()
-        elapsed = datetime.now() - self.code_generated_at
-        remaining = self.pairing_timeout - elapsed.total_seconds()
+        remaining = self.pairing_timeout - (time.monotonic() - generated)
         return max(0.0, remaining)
 
     def verify_pairing_code(self, code: str) -> tuple[bool, str]:
@@ -95,8 +119,9 @@ class PairingManager:
         # Increment attempts
         self.pairing_attempts += 1
 
-        # Verify code
-        if code == self.current_pairing_code:
+        # Verify code in constant time so the response does not reveal how
+        # many leading digits were correct
+        if hmac.compare_digest(code.encode(), self.current_pairing_code.encode()):
             return True, ""
         else:
             remaining_attempts = self.max_attempts - self.pairing_attempts
@@ -109,7 +134,8 @@ class PairingManager:
     def clear_pairing_code(self):
         """Clear the current pairing code and reset state."""
         self.current_pairing_code = None
-        self.code_generated_at = None
+        self._code_generated_monotonic = None
+        self._code_generated_time = None
         self.pairing_attempts = 0
 
     def get_current_code(self) -> Optional[str]:
@@ -139,9 +165,17 @@ class PairingManager:
         Returns:
             Dictionary with pairing status information
         """
-        code = self.get_current_code()
-
-        if code is None:
+        # Read the clock once for both the expiry check and the remaining time
+        code = self.current_pairing_code
+        generated = self._code_generated_monotonic
+        remaining = 0.0
+        if code is not None and generated is not None:
+            remaining = self.pairing_timeout - (time.monotonic() - generated)
+
+        if remaining <= 0:
+            # Expired codes are cleared, as get_current_code() does
+            if code is not None:
+                self.clear_pairing_code()
             return {
                 "active": False,
                 "code": None,
@@ -152,6 +186,6 @@ class PairingManager:
         return {
             "active": True,
             "code": code,
-            "remaining_time": self.get_remaining_time(),
+            "remaining_time": remaining,
             "attempts_remaining": self.max_attempts - self.pairing_attempts,
         }
@@ -6,16 +6,66 @@ and session persistence to disk.
 Milestone 3 deliverable.
 """
 
+import atexit
 import base64
 import json
 import os
-from dataclasses import asdict, dataclass
+import time
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+from tandem_simulator.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+# Live session managers, so changes still held back by their flush interval
+# are saved when the interpreter exits
+_live_managers: "weakref.WeakSet[SessionManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_at_exit():
+    """Save pending changes of every live SessionManager at interpreter exit."""
+    for manager in list(_live_managers):
+        manager.flush()
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize session data to compact JSON bytes.
+
+    Args:
+        data: Session file contents
+
+    Returns:
+        UTF-8 JSON without indentation (orjson when installed)
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse session data from JSON bytes.
+
+    Args:
+        raw: Session file contents
+
+    Returns:
+        Parsed session file data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Session:
     """Represents an authenticated session."""
 
@@ -43,28 +93,50 @@ class Session:
         Returns:
             Dictionary with session data
         """
-        return asdict(self)
+        # All fields are flat values, so a literal dict matches asdict() without
+        # its recursive deep copy
+        return {
+            "device_address": self.device_address,
+            "session_key_b64": self.session_key_b64,
+            "paired_at": self.paired_at,
+            "device_name": self.device_name,
+            "last_connected": self.last_connected,
+        }
 
 
 class SessionManager:
     """Manages authenticated sessions and paired devices with persistence."""
 
-    def __init__(self, storage_path: str = "config/paired_devices.json"):
+    def __init__(
+        self, storage_path: str = "config/paired_devices.json", flush_interval: float = 5.0
+    ):
         """Initialize the session manager.
 
         Args:
             storage_path: Path to store paired device data
+            flush_interval: Minimum seconds between saves triggered by
+                last-connected updates; pairing changes are saved immediately
         """
         self.storage_path = storage_path
+        self.flush_interval = flush_interval
         self.sessions: Dict[str, Session] = {}
         self.current_session: Optional[Session] = None
 
+        # Decoded session keys, each paired with the Session it was decoded from
+        self._key_cache: Dict[str, Tuple[Session, bytes]] = {}
+
+        # Unsaved changes and when storage was last written (monotonic clock)
+        self._dirty = False
+        self._last_flush = float("-inf")
+
         # Create config directory if it doesn't exist
         self._ensure_config_dir()
 
         # Load existing sessions
         self.load_sessions()
 
+        _live_managers.add(self)
+
     def _ensure_config_dir(self):
         """Ensure config directory exists."""
         config_dir = Path(self.storage_path).parent
@@ -89,19 +161,22 @@ class SessionManager:
         # Encode session key to base64 for JSON storage
         session_key_b64 = base64.b64encode(session_key).decode("ascii")
 
+        # Pairing, first connection and the save all share one timestamp
+        now = datetime.now().isoformat()
         session = Session(
             device_address=device_address,
             session_key_b64=session_key_b64,
-            paired_at=datetime.now().isoformat(),
+            paired_at=now,
             device_name=device_name,
-            last_connected=datetime.now().isoformat(),
+            last_connected=now,
         )
 
         self.sessions[device_address] = session
         self.current_session = session
+        self._key_cache[device_address] = (session, session_key)
 
         # Persist to disk
-        self.save_sessions()
+        self.save_sessions(saved_at=now)
 
         return session
 
@@ -125,10 +200,17 @@ class SessionManager:
         Returns:
             Session key bytes if found, None otherwise
         """
-        session = self.get_session(device_address)
-        if session:
-            return base64.b64decode(session.session_key_b64)
-        return None
+        session = self.sessions.get(device_address)
+        if session is None:
+            return None
+
+        # Decode once per session; a replaced session misses the identity check
+        cached = self._key_cache.get(device_address)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+        session_key = base64.b64decode(session.session_key_b64)
+        self._key_cache[device_address] = (session, session_key)
+        return session_key
 
     def update_last_connected(self, device_address: str):
         """Update last connected timestamp for a device.
@@ -139,6 +221,26 @@ class SessionManager:
         session = self.get_session(device_address)
         if session:
             session.last_connected = datetime.now().isoformat()
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        """Record an unsaved change, saving now if the last save is old enough.
+
+        Changes made within flush_interval of the previous save are
+        coalesced into the next save or flush(); anything still pending is
+        flushed at interpreter exit.
+        """
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.save_sessions()
+
+    def flush(self):
+        """Save any pending changes to storage.
+
+        Runs automatically at interpreter exit; call it directly to save
+        earlier (e.g. when a device disconnects).
+        """
+        if self._dirty:
             self.save_sessions()
 
     def remove_session(self, device_address: str) -> bool:
@@ -152,36 +254,72 @@ class SessionManager:
         """
         if device_address in self.sessions:
             del self.sessions[device_address]
+            self._key_cache.pop(device_address, None)
             if self.current_session and self.current_session.device_address == device_address:
                 self.current_session = None
             self.save_sessions()
             return True
         return False
 
-    def save_sessions(self):
-        """Save paired device data to storage."""
+    def save_sessions(self, saved_at: Optional[str] = None):
+        """Save paired device data to storage.
+
+        Args:
+            saved_at: ISO timestamp to record for the save, for callers that
+                already took one for the change being saved (current time if None)
+        """
         try:
             data = {
                 "version": 1,
-                "saved_at": datetime.now().isoformat(),
+                "saved_at": saved_at or datetime.now().isoformat(),
                 "sessions": {addr: session.to_dict() for addr, session in self.sessions.items()},
             }
 
-            with open(self.storage_path, "w") as f:
-                json.dump(data, f, indent=2)
+            # Serialize up front so the file gets a single write; the file is
+            # machine-read only, so it is written without indentation
+            self._write_atomic(_dumps(data))
+
+            self._dirty = False
+            self._last_flush = time.monotonic()
 
         except Exception as e:
             # Log error but don't crash
             print(f"Warning: Failed to save sessions: {e}")
 
+    def _write_atomic(self, content: bytes):
+        """Replace the storage file with content without ever exposing a partial file.
+
+        The content goes to a sibling temporary file that is synced to disk and
+        then renamed over the storage file, so a crash leaves either the old or
+        the new file intact. The file is created readable by the owner only,
+        as it holds session keys.
+
+        Args:
+            content: Serialized session data
+        """
+        tmp_path = self.storage_path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def load_sessions(self):
         """Load paired device data from storage."""
         try:
             if not os.path.exists(self.storage_path):
                 return
 
-            with open(self.storage_path, "r") as f:
-                data = json.load(f)
+            with open(self.storage_path, "rb") as f:
+                data = _loads(f.read())
 
             # Check version
             if data.get("version") != 1:
@@ -203,6 +341,7 @@ class SessionManager:
     def clear_all_sessions(self):
         """Clear all paired devices."""
         self.sessions.clear()
+        self._key_cache.clear()
         self.current_session = None
         self.save_sessions()
 
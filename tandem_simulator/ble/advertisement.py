@@ -4,7 +4,7 @@ This module handles broadcasting the pump as a discoverable BLE peripheral
 with the correct service UUIDs and device name.
 """
 
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 import dbus
 import dbus.service
@@ -24,6 +24,9 @@ LE_ADVERTISEMENT_IFACE = "org.bluez.LEAdvertisement1"
 DBUS_OM_IFACE = "org.freedesktop.DBus.ObjectManager"
 DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
 
+# Object path of the first Bluetooth adapter on most systems
+DEFAULT_ADAPTER_PATH = "/org/bluez/hci0"
+
 
 class BLEAdvertisement(dbus.service.Object):
     """D-Bus service object implementing the BlueZ LEAdvertisement1 interface."""
@@ -41,18 +44,62 @@ class BLEAdvertisement(dbus.service.Object):
         self.path = f"{self.PATH_BASE}{index}"
         self.bus = bus
         self.ad_type = ad_type
-        self.service_uuids: list = []
-        self.local_name: Optional[str] = None
-        self.include_tx_power = True
+        self._service_uuids: Tuple[str, ...] = ()
+        self._local_name: Optional[str] = None
+        self._include_tx_power = True
+
+        # D-Bus properties dict built by get_properties(); the setters below
+        # clear it whenever an advertised value changes
+        self._cached_props: Optional[dict] = None
 
         super().__init__(bus, self.path)
 
+    @property
+    def service_uuids(self) -> Tuple[str, ...]:
+        """Advertised service UUIDs.
+
+        Held as a tuple so they can only be changed by assignment, which
+        keeps the cached properties in step.
+        """
+        return self._service_uuids
+
+    @service_uuids.setter
+    def service_uuids(self, value: Iterable[str]) -> None:
+        self._service_uuids = tuple(value)
+        self._cached_props = None
+
+    @property
+    def local_name(self) -> Optional[str]:
+        """Advertised local device name."""
+        return self._local_name
+
+    @local_name.setter
+    def local_name(self, value: Optional[str]) -> None:
+        self._local_name = value
+        self._cached_props = None
+
+    @property
+    def include_tx_power(self) -> bool:
+        """Whether the advertisement includes the TX power level."""
+        return self._include_tx_power
+
+    @include_tx_power.setter
+    def include_tx_power(self, value: bool) -> None:
+        self._include_tx_power = value
+        self._cached_props = None
+
     def get_properties(self) -> dict:
         """Get advertisement properties for D-Bus.
 
+        The D-Bus typed values are built once and reused until one of the
+        advertised attributes is assigned.
+
         Returns:
             Dictionary of advertisement properties
         """
+        if self._cached_props is not None:
+            return self._cached_props
+
         properties = {"Type": self.ad_type}
 
         if self.service_uuids:
@@ -64,7 +111,8 @@ class BLEAdvertisement(dbus.service.Object):
         if self.include_tx_power:
             properties["IncludeTxPower"] = dbus.Boolean(True)
 
-        return {LE_ADVERTISEMENT_IFACE: properties}
+        self._cached_props = {LE_ADVERTISEMENT_IFACE: properties}
+        return self._cached_props
 
     def get_path(self) -> str:
         """Get the D-Bus object path.
@@ -91,10 +139,21 @@ class BLEAdvertisement(dbus.service.Object):
 
         return self.get_properties()[LE_ADVERTISEMENT_IFACE]
 
+    @dbus.service.signal(DBUS_PROP_IFACE, signature="sa{sv}as")
+    def PropertiesChanged(self, interface, changed, invalidated):
+        """Signal emitted when advertisement properties change.
+
+        Args:
+            interface: Interface name
+            changed: Dictionary of changed properties
+            invalidated: List of invalidated properties
+        """
+        pass
+
     @dbus.service.method(LE_ADVERTISEMENT_IFACE, in_signature="", out_signature="")
     def Release(self):
         """Release the advertisement (called by BlueZ when unregistering)."""
-        logger.debug(f"Advertisement {self.path} released")
+        logger.debug("Advertisement %s released", self.path)
 
 
 class Advertisement:
@@ -118,16 +177,28 @@ class Advertisement:
         self.ad_manager: Optional[dbus.Interface] = None
         self.advertisement: Optional[BLEAdvertisement] = None
 
-        logger.info(f"Advertisement initialized: {self.device_name}")
+        logger.info("Advertisement initialized: %s", self.device_name)
 
     def _find_adapter(self) -> Optional[str]:
         """Find the Bluetooth adapter object path.
 
+        The default adapter is probed directly first, which is a much smaller
+        D-Bus call than listing every object BlueZ manages.
+
         Returns:
             Adapter object path if found, None otherwise
         """
+        assert self.bus is not None
+        try:
+            dbus.Interface(
+                self.bus.get_object(BLUEZ_SERVICE_NAME, DEFAULT_ADAPTER_PATH), DBUS_PROP_IFACE
+            ).GetAll(LE_ADVERTISING_MANAGER_IFACE)
+            return DEFAULT_ADAPTER_PATH
+        except dbus.exceptions.DBusException:
+            # Missing adapter or no advertising support; search all objects
+            pass
+
         try:
-            assert self.bus is not None
             remote_om = dbus.Interface(self.bus.get_object(BLUEZ_SERVICE_NAME, "/"), DBUS_OM_IFACE)
             objects = remote_om.GetManagedObjects()
 
@@ -139,7 +210,7 @@ class Advertisement:
             return None
 
         except dbus.exceptions.DBusException as e:
-            logger.error(f"Error finding Bluetooth adapter: {e}")
+            logger.error("Error finding Bluetooth adapter: %s", e)
             return None
 
     def start(self):
@@ -178,14 +249,14 @@ class Advertisement:
             )
 
             self.is_advertising = True
-            logger.info(f"Advertisement started: {self.device_name}")
-            logger.info(f"Advertising service UUID: {PUMP_SERVICE_UUID}")
+            logger.info("Advertisement started: %s", self.device_name)
+            logger.info("Advertising service UUID: %s", PUMP_SERVICE_UUID)
 
         except dbus.exceptions.DBusException as e:
-            logger.error(f"Failed to start advertisement: {e}")
+            logger.error("Failed to start advertisement: %s", e)
             raise RuntimeError(f"Advertisement failed: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error starting advertisement: {e}")
+            logger.error("Unexpected error starting advertisement: %s", e)
             raise
 
     def stop(self):
@@ -209,23 +280,31 @@ class Advertisement:
             self.is_advertising = False
 
         except dbus.exceptions.DBusException as e:
-            logger.error(f"Failed to stop advertisement: {e}")
+            logger.error("Failed to stop advertisement: %s", e)
             # Still mark as not advertising even if unregistration failed
             self.is_advertising = False
         except Exception as e:
-            logger.error(f"Unexpected error stopping advertisement: {e}")
+            logger.error("Unexpected error stopping advertisement: %s", e)
             self.is_advertising = False
 
     def update_serial_number(self, serial_number: str):
         """Update the serial number and device name.
 
+        A running advertisement stays registered; BlueZ is told about the
+        new LocalName through a PropertiesChanged signal.
+
         Args:
             serial_number: New serial number
         """
         self.serial_number = serial_number
         self.device_name = f"{DEVICE_NAME_PREFIX} {self.serial_number}"
 
-        if self.is_advertising:
-            logger.info("Restarting advertisement with new device name")
-            self.stop()
-            self.start()
+        if self.is_advertising and self.advertisement:
+            logger.info("Updating advertised device name")
+            # Assigning local_name clears the cached properties, so they are
+            # rebuilt here with the new name for the signal and later GetAll calls
+            self.advertisement.local_name = self.device_name
+            properties = self.advertisement.get_properties()[LE_ADVERTISEMENT_IFACE]
+            self.advertisement.PropertiesChanged(
+                LE_ADVERTISEMENT_IFACE, {"LocalName": properties["LocalName"]}, []
+            )
@@ -4,15 +4,18 @@ This module handles tracking connected central devices, managing MTU negotiation
 and handling connection/disconnection events.
 """
 
+import time
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Dict, Optional
 
+from tandem_simulator.utils.compat import DATACLASS_SLOTS
 from tandem_simulator.utils.logger import get_logger
 
 logger = get_logger()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ConnectionInfo:
     """Information about a connected BLE device."""
 
@@ -20,7 +23,19 @@ class ConnectionInfo:
     device_name: Optional[str] = None
     mtu: int = 23  # Default BLE MTU
     bonded: bool = False
-    connected_at: Optional[str] = None
+    connected_at_ns: Optional[int] = None  # time.monotonic_ns() at connection
+
+    @property
+    def connected_at(self) -> Optional[str]:
+        """Local time of the connection as an ISO string, formatted for display.
+
+        Returns:
+            ISO timestamp, or None if the connection time is unknown
+        """
+        if self.connected_at_ns is None:
+            return None
+        age = (time.monotonic_ns() - self.connected_at_ns) / 1e9
+        return datetime.fromtimestamp(time.time() - age).isoformat()
 
 
 class ConnectionManager:
@@ -43,19 +58,17 @@ class ConnectionManager:
             device_address: BLE address of the connected device
             device_name: Name of the connected device (optional)
         """
-        from datetime import datetime
-
         connection_info = ConnectionInfo(
             device_address=device_address,
             device_name=device_name,
-            connected_at=datetime.now().isoformat(),
+            connected_at_ns=time.monotonic_ns(),
         )
 
         self.connections[device_address] = connection_info
         self.current_connection = connection_info
 
         logger.log_connection(device_address)
-        logger.info(f"Connected device: {device_name or 'Unknown'} ({device_address})")
+        logger.info("Connected device: %s (%s)", device_name or "Unknown", device_address)
 
     def handle_disconnection(self, device_address: str):
         """Handle device disconnection.
@@ -66,7 +79,7 @@ class ConnectionManager:
         if device_address in self.connections:
             connection_info = self.connections.pop(device_address)
             logger.log_disconnection(device_address)
-            logger.info(f"Disconnected device: {connection_info.device_name or 'Unknown'}")
+            logger.info("Disconnected device: %s", connection_info.device_name or "Unknown")
 
             if self.current_connection and self.current_connection.device_address == device_address:
                 self.current_connection = None
@@ -80,7 +93,7 @@ class ConnectionManager:
         """
         if device_address in self.connections:
             self.connections[device_address].mtu = mtu
-            logger.info(f"MTU negotiated for {device_address}: {mtu} bytes")
+            logger.info("MTU negotiated for %s: %s bytes", device_address, mtu)
 
     def get_connection(self, device_address: str) -> Optional[ConnectionInfo]:
         """Get connection information for a device.
@@ -66,7 +66,7 @@ class EventHandlers:
             timestamp=state.time_since_reset,
         )
         self.pending_events.append(event)
-        logger.info(f"Generated low battery alert: {event.message}")
+        logger.info("Generated low battery alert: %s", event.message)
         return event
 
     def generate_low_insulin_alert(self) -> PumpEvent:
@@ -84,7 +84,7 @@ class EventHandlers:
             timestamp=state.time_since_reset,
         )
         self.pending_events.append(event)
-        logger.info(f"Generated low insulin alert: {event.message}")
+        logger.info("Generated low insulin alert: %s", event.message)
         return event
 
     def generate_bolus_complete_notification(self, amount: float) -> PumpEvent:
@@ -105,7 +105,7 @@ class EventHandlers:
             timestamp=state.time_since_reset,
         )
         self.pending_events.append(event)
-        logger.info(f"Generated bolus complete notification: {event.message}")
+        logger.info("Generated bolus complete notification: %s", event.message)
         return event
 
     def generate_occlusion_alarm(self) -> PumpEvent:
@@ -123,7 +123,7 @@ class EventHandlers:
             timestamp=state.time_since_reset,
         )
         self.pending_events.append(event)
-        logger.warning(f"Generated occlusion alarm: {event.message}")
+        logger.warning("Generated occlusion alarm: %s", event.message)
         return event
 
     def handle_event_acknowledgment(self, message: Message) -> Message:
@@ -135,7 +135,7 @@ class EventHandlers:
         Returns:
             Acknowledgment response message
         """
-        logger.debug(f"Event acknowledgment received: transaction_id={message.transaction_id}")
+        logger.debug("Event acknowledgment received: transaction_id=%s", message.transaction_id)
 
         # Stub implementation: mark all pending events as acknowledged
         for event in self.pending_events:
@@ -166,7 +166,7 @@ class EventHandlers:
     def clear_acknowledged_events(self):
         """Remove all acknowledged events from the pending list."""
         self.pending_events = [e for e in self.pending_events if not e.acknowledged]
-        logger.debug(f"Cleared acknowledged events. {len(self.pending_events)} events remaining")
+        logger.debug("Cleared acknowledged events. %d events remaining", len(self.pending_events))
 
     def check_and_generate_alerts(self):
         """Check pump state and generate alerts if needed.
@@ -40,7 +40,7 @@ class HistoryHandlers:
             History log response message (stub - empty history)
         """
         logger.debug(
-            f"History log request received (stub): transaction_id={message.transaction_id}"
+            "History log request received (stub): transaction_id=%s", message.transaction_id
         )
 
         # For Milestone 4, we return an empty history response
@@ -66,7 +66,7 @@ class HistoryHandlers:
             History log stream response message (stub)
         """
         logger.debug(
-            f"History log stream request received (stub): transaction_id={message.transaction_id}"
+            "History log stream request received (stub): transaction_id=%s", message.transaction_id
         )
 
         # Stub: return the request as-is
@@ -68,7 +68,7 @@ class RequestHandler:
             handler: Handler function
         """
         self.handlers[opcode] = handler
-        logger.debug(f"Registered handler for opcode {opcode}")
+        logger.debug("Registered handler for opcode %s", opcode)
 
     def handle_request(self, message: Message) -> Optional[Message]:
         """Handle a request message.
@@ -81,15 +81,17 @@ class RequestHandler:
         """
         handler = self.handlers.get(message.opcode)
         if handler:
-            logger.debug(f"Handling request with opcode {message.opcode}")
+            logger.debug("Handling request with opcode %s", message.opcode)
             try:
                 return handler(message)
             except Exception as e:
                 logger.error(
-                    f"Error handling request with opcode {message.opcode}: {e}",
+                    "Error handling request with opcode %s: %s",
+                    message.opcode,
+                    e,
                     exc_info=True,
                 )
                 return None
         else:
-            logger.warning(f"No handler registered for opcode {message.opcode}")
+            logger.warning("No handler registered for opcode %s", message.opcode)
             return None
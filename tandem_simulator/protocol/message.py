@@ -13,7 +13,7 @@ Milestone 2 deliverable.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Type
+from typing import Dict, Iterable, Optional, Tuple, Type
 
 from tandem_simulator.utils.constants import HMAC_SIZE, MESSAGE_HEADER_SIZE
 
@@ -217,6 +217,15 @@ class MessageRegistry:
         """
         cls._registry[opcode] = message_class
 
+    @classmethod
+    def register_many(cls, items: Iterable[Tuple[int, Type[Message]]]):
+        """Register several message classes in a single registry update.
+
+        Args:
+            items: Iterable of (opcode, message_class) pairs
+        """
+        cls._registry.update(items)
+
     @classmethod
     def get_message_class(cls, opcode: int) -> Optional[Type[Message]]:
         """Get the message class for an opcode.
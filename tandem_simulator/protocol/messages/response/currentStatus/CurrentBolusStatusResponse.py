@@ -1,13 +1,16 @@
 """Current bolus status response message."""
 
+import struct
+
 from tandem_simulator.protocol.message import Message, MessageRegistry
 from tandem_simulator.protocol.messages.util.bytes import (
     read_uint16_le,
     read_uint32_le,
-    write_uint16_le,
-    write_uint32_le,
 )
 
+# Whole 15-byte payload; the second "H" is the 2-byte zero padding
+_PAYLOAD_STRUCT = struct.Struct("<BHHIIBB")
+
 
 class CurrentBolusStatusResponse(Message):
     """Current bolus status response message.
@@ -123,14 +126,14 @@ class CurrentBolusStatusResponse(Message):
         Returns:
             15-byte payload buffer
         """
-        return (
-            bytes([self.status_id])
-            + write_uint16_le(self.bolus_id)
-            + b"\x00\x00"  # 2 bytes padding
-            + write_uint32_le(self.timestamp)
-            + write_uint32_le(self.requested_volume)
-            + bytes([self.bolus_source_id])
-            + bytes([self.bolus_type_bitmask])
+        return _PAYLOAD_STRUCT.pack(
+            self.status_id,
+            self.bolus_id,
+            0,  # 2 bytes padding
+            self.timestamp,
+            self.requested_volume,
+            self.bolus_source_id,
+            self.bolus_type_bitmask,
         )
 
     def is_valid(self) -> bool:
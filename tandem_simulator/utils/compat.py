@@ -0,0 +1,7 @@
+"""Python version compatibility helpers for the Tandem pump simulator."""
+
+import sys
+
+# Keyword arguments for @dataclass that make it generate __slots__ (no
+# per-instance __dict__); dataclass(slots=True) needs Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
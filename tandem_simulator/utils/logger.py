@@ -92,21 +92,21 @@ class SimulatorLogger:
             f"Payload: {payload.hex() if payload else 'empty'}"
         )
 
-    def info(self, message: str):
-        """Log an info message."""
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        """Log an info message, formatting any %-style args lazily."""
+        self.logger.info(message, *args)
 
-    def debug(self, message: str):
-        """Log a debug message."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log a debug message, formatting any %-style args lazily."""
+        self.logger.debug(message, *args)
 
-    def warning(self, message: str):
-        """Log a warning message."""
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        """Log a warning message, formatting any %-style args lazily."""
+        self.logger.warning(message, *args)
 
-    def error(self, message: str):
-        """Log an error message."""
-        self.logger.error(message)
+    def error(self, message: str, *args):
+        """Log an error message, formatting any %-style args lazily."""
+        self.logger.error(message, *args)
 
 
 # Global logger instance
@@ -1,14 +1,20 @@
 """Tests for authentication components (Milestone 3)."""
 
+import base64
+import hashlib
+import hmac
 import os
+import subprocess
+import sys
 import tempfile
 import time
 from datetime import datetime, timedelta
 
 import pytest
+from cryptography.hazmat.primitives import serialization
 
 from tandem_simulator.authentication.authenticator import AuthenticationState, Authenticator
-from tandem_simulator.authentication.jpake import JPakeProtocol
+from tandem_simulator.authentication.jpake import JPakeProtocol, _bytes_to_point, _point_to_bytes
 from tandem_simulator.authentication.pairing import PairingManager
 from tandem_simulator.authentication.session import Session, SessionManager
 from tandem_simulator.protocol.messages import (
@@ -55,6 +61,54 @@ def test_jpake_generate_round1_app():
     assert jpake.G4 is not None
 
 
+def test_jpake_precomputed_secret():
+    """Test a secret derived up front matches the one derived in the constructor."""
+    secret = JPakeProtocol.derive_secret("123456")
+
+    assert JPakeProtocol(pairing_code="123456").s == secret
+    assert JPakeProtocol(pairing_code="123456", secret=secret).s == secret
+
+
+def test_jpake_scalars_reduced_modulo_group_order():
+    """Test the secret and Round 2 scalars are reduced modulo the P-256 order, not 256."""
+    from tandem_simulator.authentication.jpake import _P256_ORDER
+
+    secret = JPakeProtocol.derive_secret("123456")
+    digest = hashlib.sha256(b"123456").digest()
+    assert secret == int.from_bytes(digest, "big") % _P256_ORDER
+    assert 0 < secret < _P256_ORDER
+
+    pump = JPakeProtocol(pairing_code="123456", role="pump")
+    app = JPakeProtocol(pairing_code="123456", role="app")
+    pump.generate_round1()
+    pump.process_round1(*app.generate_round1())
+    # x2 * s is a multiple of 256, which used to reduce to the invalid scalar 0
+    pump.x2 = 256
+    assert pump.generate_round2() == _point_to_bytes(pump._scalar_mult(256 * secret % _P256_ORDER))
+
+
+def test_jpake_round1_points_match_scalars():
+    """Test Round 1 points are the generator multiplied by the private scalars."""
+    pump = JPakeProtocol(pairing_code="123456", role="pump")
+    g1, g2 = pump.generate_round1()
+
+    assert g1 == _point_to_bytes(pump._scalar_mult(pump.x1))
+    assert g2 == _point_to_bytes(pump._scalar_mult(pump.x2))
+
+
+def test_jpake_generate_random_point():
+    """Test generating a standalone valid EC point."""
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    jpake = JPakeProtocol(pairing_code="123456", role="pump")
+    point = jpake.generate_random_point()
+
+    assert len(point) == 65
+    assert point[0] == 0x04
+    # Must decode as a point on the curve
+    ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), point)
+
+
 def test_jpake_full_exchange():
     """Test complete JPake key exchange between pump and app."""
     pairing_code = "123456"
@@ -102,6 +156,84 @@ def test_jpake_full_exchange():
     assert pump.verify_key_confirmation(app_confirmation, "app")
 
 
+def test_jpake_session_key_is_hmac_of_transcript():
+    """Test the session key is HMAC-SHA256 keyed with the pairing code over all points."""
+    pump = JPakeProtocol(pairing_code="654321", role="pump")
+    app = JPakeProtocol(pairing_code="654321", role="app")
+
+    g1, g2 = pump.generate_round1()
+    app.process_round1(g1, g2)
+    g3, g4 = app.generate_round1()
+    pump.process_round1(g3, g4)
+    a_value = pump.generate_round2()
+    b_value = app.generate_round2()
+    pump.process_round2(b_value)
+
+    transcript = g1 + g2 + g3 + g4 + a_value + b_value
+    expected = hmac.new(b"654321", transcript, hashlib.sha256).digest()
+    assert pump.derive_session_key() == expected
+
+
+def test_jpake_session_key_accepts_compressed_points():
+    """Test the session key does not depend on how a received point was encoded."""
+    pump = JPakeProtocol(pairing_code="123456", role="pump")
+    app = JPakeProtocol(pairing_code="123456", role="app")
+
+    g3, g4 = app.generate_round1()
+    app.process_round1(*pump.generate_round1())
+    pump.process_round1(g3, g4)
+    pump.generate_round2()
+    b_value = app.generate_round2()
+    pump.process_round2(b_value)
+    key = pump.derive_session_key()
+
+    def compress(point):
+        return _bytes_to_point(point).public_bytes(
+            serialization.Encoding.X962, serialization.PublicFormat.CompressedPoint
+        )
+
+    pump.process_round1(compress(g3), compress(g4))
+    pump.process_round2(compress(b_value))
+    assert pump.derive_session_key() == key
+
+
+def test_jpake_session_key_memoized():
+    """Test the session key is derived once and re-derived after a round value changes."""
+    pump = JPakeProtocol(pairing_code="123456", role="pump")
+    app = JPakeProtocol(pairing_code="123456", role="app")
+
+    pump.process_round1(*app.generate_round1())
+    app.process_round1(*pump.generate_round1())
+    pump.generate_round2()
+    pump.process_round2(app.generate_round2())
+
+    key = pump.derive_session_key()
+    confirmation = pump.generate_key_confirmation()
+    assert pump.derive_session_key() is key
+    assert pump.generate_key_confirmation() is confirmation
+
+    other_app = JPakeProtocol(pairing_code="123456", role="app")
+    other_app.generate_round1()
+    other_app.process_round1(_point_to_bytes(pump.G1), _point_to_bytes(pump.G2))
+    pump.process_round2(other_app.generate_round2())
+    assert pump.get_session_key() is None
+    assert pump.derive_session_key() != key
+    assert pump.generate_key_confirmation() != confirmation
+
+
+def test_jpake_key_confirmation_matches_hmac():
+    """Test confirmations from the cached HMAC template match a freshly keyed HMAC."""
+    pump = JPakeProtocol(pairing_code="123456", role="pump")
+    for key in (os.urandom(32), os.urandom(32)):
+        pump.session_key = key
+        pump._key_confirmation = None
+        expected = hmac.new(key, b"JPake-Confirmation-pump", hashlib.sha256).digest()
+        assert pump.generate_key_confirmation() == expected
+        app_confirmation = hmac.new(key, b"JPake-Confirmation-app", hashlib.sha256).digest()
+        assert pump.verify_key_confirmation(app_confirmation, "app")
+        assert pump.verify_key_confirmation(app_confirmation, "app")
+
+
 def test_jpake_invalid_confirmation():
     """Test JPake with invalid key confirmation."""
     pairing_code = "123456"
@@ -170,6 +302,47 @@ def test_pairing_manager_timeout():
     assert manager.get_current_code() is None
 
 
+def test_pairing_manager_expiry_uses_monotonic_clock():
+    """Test expiry follows the monotonic clock while the generation time stays reportable."""
+    manager = PairingManager(timeout_seconds=60)
+    assert manager.code_generated_at is None
+
+    before = datetime.now()
+    manager.generate_pairing_code()
+    generated_at = manager.code_generated_at
+    assert generated_at is not None
+    assert before - timedelta(seconds=1) <= generated_at <= datetime.now()
+    assert 59 < manager.get_remaining_time() <= 60
+
+    manager._code_generated_monotonic = time.monotonic() - 61
+    assert manager.is_code_expired()
+    assert manager.get_remaining_time() == 0.0
+    assert manager.get_current_code() is None
+    assert manager.code_generated_at is None
+
+
+def test_pairing_manager_get_status():
+    """Test pairing status for active, expired and absent codes."""
+    manager = PairingManager(timeout_seconds=60)
+    assert manager.get_status() == {
+        "active": False,
+        "code": None,
+        "remaining_time": 0,
+        "attempts_remaining": 3,
+    }
+
+    code = manager.generate_pairing_code()
+    manager.verify_pairing_code("not-it")
+    status = manager.get_status()
+    assert status["active"] and status["code"] == code
+    assert 59 < status["remaining_time"] <= 60
+    assert status["attempts_remaining"] == 2
+
+    manager._code_generated_monotonic = time.monotonic() - 60
+    assert not manager.get_status()["active"]
+    assert manager.current_pairing_code is None
+
+
 def test_pairing_manager_max_attempts():
     """Test max pairing attempts."""
     manager = PairingManager()
@@ -211,6 +384,30 @@ def test_session_manager_create_session():
         assert manager.get_session_key("AA:BB:CC:DD:EE:FF") == session_key
 
 
+def test_session_to_dict_round_trip():
+    """Test Session.to_dict lists every field and round-trips through from_dict."""
+    import dataclasses
+
+    session = Session("AA:BB:CC:DD:EE:FF", "a2V5", "2024-01-01T00:00:00", "Phone", None)
+
+    assert session.to_dict() == dataclasses.asdict(session)
+    assert Session.from_dict(session.to_dict()) == session
+
+
+def test_session_manager_create_session_single_timestamp():
+    """Test a new session's pairing, connection and save times are the same instant."""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        manager = SessionManager(storage_path=storage_path)
+        session = manager.create_session("AA:BB:CC:DD:EE:FF", b"k" * 32)
+
+        assert session.paired_at == session.last_connected
+        with open(storage_path, "rb") as f:
+            assert json.loads(f.read())["saved_at"] == session.paired_at
+
+
 def test_session_manager_persistence():
     """Test session persistence to disk."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -229,6 +426,124 @@ def test_session_manager_persistence():
         assert manager2.is_device_paired("AA:BB:CC:DD:EE:FF")
 
 
+def test_session_manager_coalesces_last_connected_saves():
+    """Test last-connected updates are deferred until the flush interval or flush()."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        manager = SessionManager(storage_path=storage_path, flush_interval=60)
+        manager.create_session("AA:BB:CC:DD:EE:FF", b"k" * 32)
+
+        def stored_last_connected():
+            loaded = SessionManager(storage_path=storage_path)
+            return loaded.get_session("AA:BB:CC:DD:EE:FF").last_connected
+
+        saved = stored_last_connected()
+        manager.update_last_connected("AA:BB:CC:DD:EE:FF")
+        manager.update_last_connected("AA:BB:CC:DD:EE:FF")
+        assert stored_last_connected() == saved
+
+        manager.flush()
+        current = manager.get_session("AA:BB:CC:DD:EE:FF").last_connected
+        assert current != saved
+        assert stored_last_connected() == current
+
+
+def test_session_manager_flushes_pending_changes_at_exit():
+    """Test a last-connected update held back by the flush interval is saved at exit."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        code = (
+            "import sys, time\n"
+            "from tandem_simulator.authentication.session import SessionManager\n"
+            "manager = SessionManager(storage_path=sys.argv[1], flush_interval=60)\n"
+            "manager.create_session('AA:BB:CC:DD:EE:FF', b'k' * 32)\n"
+            "time.sleep(0.01)  # last_connected must differ from the saved value\n"
+            "manager.update_last_connected('AA:BB:CC:DD:EE:FF')\n"
+            "assert manager._dirty\n"
+            "print(manager.get_session('AA:BB:CC:DD:EE:FF').last_connected)\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code, storage_path],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=repo_root,
+        )
+
+        loaded = SessionManager(storage_path=storage_path)
+        assert loaded.get_session("AA:BB:CC:DD:EE:FF").last_connected == result.stdout.strip()
+
+
+def test_session_manager_saves_atomically(monkeypatch):
+    """Test saves replace the storage file whole and a failed save keeps the old file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        manager = SessionManager(storage_path=storage_path)
+        manager.create_session("AA:BB:CC:DD:EE:11", b"key1" * 8)
+
+        assert os.listdir(tmpdir) == ["test_sessions.json"]
+        assert os.stat(storage_path).st_mode & 0o777 == 0o600
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        manager.create_session("AA:BB:CC:DD:EE:22", b"key2" * 8)
+        monkeypatch.undo()
+
+        assert os.listdir(tmpdir) == ["test_sessions.json"]
+        loaded = SessionManager(storage_path=storage_path)
+        assert loaded.is_device_paired("AA:BB:CC:DD:EE:11")
+        assert not loaded.is_device_paired("AA:BB:CC:DD:EE:22")
+
+
+def test_session_manager_compact_file_and_indented_file_load():
+    """Test sessions are saved without indentation and older indented files still load."""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        manager = SessionManager(storage_path=storage_path)
+        manager.create_session("AA:BB:CC:DD:EE:FF", b"k" * 32, "Test Device")
+
+        with open(storage_path, "rb") as f:
+            raw = f.read()
+        assert b"\n" not in raw
+        data = json.loads(raw)
+        assert data["sessions"]["AA:BB:CC:DD:EE:FF"]["device_name"] == "Test Device"
+
+        with open(storage_path, "w") as f:
+            json.dump(data, f, indent=2)
+        loaded = SessionManager(storage_path=storage_path)
+        assert loaded.get_session_key("AA:BB:CC:DD:EE:FF") == b"k" * 32
+
+
+def test_session_manager_session_key_cache():
+    """Test decoded session keys are reused until their session is replaced or removed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        manager = SessionManager(storage_path=storage_path)
+        address = "AA:BB:CC:DD:EE:FF"
+
+        manager.create_session(address, b"k" * 32)
+        key = manager.get_session_key(address)
+        assert key == b"k" * 32
+        assert manager.get_session_key(address) is key
+
+        loaded = SessionManager(storage_path=storage_path)
+        loaded_key = loaded.get_session_key(address)
+        assert loaded_key == key
+        assert loaded.get_session_key(address) is loaded_key
+
+        manager.sessions[address] = loaded.get_session(address)
+        manager.sessions[address].session_key_b64 = base64.b64encode(b"n" * 32).decode()
+        assert manager.get_session_key(address) == b"n" * 32
+
+        manager.remove_session(address)
+        assert manager.get_session_key(address) is None
+
+
 def test_session_manager_remove_session():
     """Test removing a session."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -291,6 +606,7 @@ def test_authenticator_handle_central_challenge():
     assert response.app_instance_id == 1234
     assert len(response.central_challenge_hash) == 20  # SHA1 hash
     assert len(response.hmac_key) == 8
+    assert response.central_challenge_hash == hashlib.sha1(b"testchal" + response.hmac_key).digest()
     assert auth.state == AuthenticationState.CENTRAL_CHALLENGE_SENT
 
 
@@ -370,15 +686,18 @@ def test_authenticator_jpake_flow():
     assert auth.state == AuthenticationState.KEY_CONFIRMATION_SENT
     assert len(jpake4_req.hash_digest) == 32  # SHA256
 
-    # Complete authentication (use placeholder values for response)
-    import secrets
+    # Complete authentication with the app's confirmation digest
+    from tandem_simulator.authentication.jpake_encoding import generate_jpake4_hash_digest
 
+    app_nonce = os.urandom(8)
     jpake4_resp = Jpake4KeyConfirmationResponse(
         transaction_id=5,
         app_instance_id=auth.app_instance_id,
-        nonce=secrets.token_bytes(8),
+        nonce=app_nonce,
         reserved=b"\x00" * 8,
-        hash_digest=secrets.token_bytes(32),
+        hash_digest=generate_jpake4_hash_digest(
+            auth.jpake_protocol.get_session_key(), "app", app_nonce, b"\x00" * 8
+        ),
     )
     auth.handle_jpake4_response(jpake4_resp)
 
@@ -387,6 +706,208 @@ def test_authenticator_jpake_flow():
     assert auth.is_authenticated("AA:BB:CC:DD:EE:FF")
 
 
+def test_authenticator_jpake4_rejects_bad_digest():
+    """Test Round 4 fails when the app's confirmation digest does not match."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        auth = Authenticator(session_manager=SessionManager(storage_path=storage_path))
+        code = auth.start_pairing("AA:BB:CC:DD:EE:FF")
+        auth.jpake_protocol = JPakeProtocol(pairing_code=code)
+        auth.jpake_protocol.session_key = os.urandom(32)
+        auth.state = AuthenticationState.KEY_CONFIRMATION_SENT
+
+        jpake4_resp = Jpake4KeyConfirmationResponse(
+            transaction_id=5,
+            app_instance_id=auth.app_instance_id,
+            nonce=os.urandom(8),
+            reserved=b"\x00" * 8,
+            hash_digest=os.urandom(32),
+        )
+        auth.handle_jpake4_response(jpake4_resp)
+
+        assert auth.state == AuthenticationState.FAILED
+        assert not auth.is_authenticated("AA:BB:CC:DD:EE:FF")
+
+
+def test_authenticator_uses_slots():
+    """Test Authenticator and JPakeProtocol instances carry no per-instance __dict__."""
+    auth = Authenticator()
+
+    assert not hasattr(auth, "__dict__")
+    with pytest.raises(AttributeError):
+        auth.unknown_attribute = 1
+
+    assert not hasattr(JPakeProtocol(pairing_code="123456"), "__dict__")
+
+
+def test_hex_log_argument():
+    """Test the lazy hex log argument formats like bytes.hex()."""
+    from tandem_simulator.authentication.authenticator import _Hex
+
+    assert str(_Hex(b"\x01\xab")) == "01ab"
+    assert "%s" % _Hex(b"") == ""
+
+
+def test_authenticator_rejects_invalid_transition():
+    """Test handlers cannot jump ahead of the handshake."""
+    auth = Authenticator()
+    auth.start_pairing("AA:BB:CC:DD:EE:FF")
+
+    with pytest.raises(ValueError):
+        auth._set_state(AuthenticationState.AUTHENTICATED)
+    assert auth.state == AuthenticationState.WAITING_FOR_PAIRING_CODE
+
+    # Failing and restarting pairing are always allowed
+    auth._set_state(AuthenticationState.FAILED)
+    auth.start_pairing("AA:BB:CC:DD:EE:FF")
+    assert auth.state == AuthenticationState.WAITING_FOR_PAIRING_CODE
+
+
+def test_authenticator_out_of_order_jpake4_creates_no_session():
+    """Test a valid Round 4 response before the pump's own confirmation is rejected."""
+    from tandem_simulator.authentication.jpake_encoding import generate_jpake4_hash_digest
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        auth = Authenticator(session_manager=SessionManager(storage_path=storage_path))
+        code = auth.start_pairing("AA:BB:CC:DD:EE:FF")
+        auth.jpake_protocol = JPakeProtocol(pairing_code=code)
+        auth.jpake_protocol.session_key = os.urandom(32)
+        auth.state = AuthenticationState.JPAKE_ROUND2_COMPLETE
+
+        nonce = os.urandom(8)
+        jpake4_resp = Jpake4KeyConfirmationResponse(
+            transaction_id=5,
+            app_instance_id=auth.app_instance_id,
+            nonce=nonce,
+            reserved=b"\x00" * 8,
+            hash_digest=generate_jpake4_hash_digest(
+                auth.jpake_protocol.session_key, "app", nonce, b"\x00" * 8
+            ),
+        )
+        auth.handle_jpake4_response(jpake4_resp)
+
+        assert auth.state == AuthenticationState.FAILED
+        assert not auth.is_authenticated("AA:BB:CC:DD:EE:FF")
+        assert not os.path.exists(storage_path)
+
+
+def test_authenticator_rejected_handler_leaves_state_untouched():
+    """Test an out-of-order request raises before the handler stores anything."""
+    auth = Authenticator()
+    auth.start_pairing("AA:BB:CC:DD:EE:FF")
+    auth.generate_jpake1a()
+    app_instance_id = auth.app_instance_id
+
+    with pytest.raises(ValueError):
+        auth.handle_central_challenge_request(
+            CentralChallengeRequest(
+                transaction_id=1, app_instance_id=app_instance_id + 1, central_challenge=b"c" * 8
+            )
+        )
+
+    assert auth.state == AuthenticationState.JPAKE_ROUND1_SENT
+    assert auth.central_challenge is None
+    assert auth.app_instance_id == app_instance_id
+
+
+def test_authenticator_callbacks():
+    """Test state and pairing-code callbacks fire once replaced."""
+    auth = Authenticator()
+    auth.start_pairing("AA:BB:CC:DD:EE:FF")  # default no-op callbacks
+
+    states, codes = [], []
+    auth.on_state_change = states.append
+    auth.on_pairing_code_generated = codes.append
+    code = auth.start_pairing("AA:BB:CC:DD:EE:FF")
+
+    assert states == [AuthenticationState.WAITING_FOR_PAIRING_CODE]
+    assert codes == [code]
+
+
+def test_authenticator_reuses_jpake_protocol():
+    """Test a reset authenticator reinitializes its previous JPakeProtocol."""
+    auth = Authenticator()
+    auth.start_pairing("AA:BB:CC:DD:EE:FF")
+    auth.generate_jpake1a()
+    first = auth.jpake_protocol
+
+    auth.reset()
+    assert auth.jpake_protocol is None
+    assert first.x1 is None and first.G1 is None
+
+    code = auth.start_pairing("AA:BB:CC:DD:EE:FF")
+    auth.generate_jpake1a()
+    assert auth.jpake_protocol is first
+    assert first.pairing_code == code
+    assert first.s == JPakeProtocol.derive_secret(code)
+    assert first.G1 is not None
+
+
+def test_authenticator_session_key_cache():
+    """Test cached session keys follow the session manager's sessions."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, "test_sessions.json")
+        auth = Authenticator(session_manager=SessionManager(storage_path=storage_path))
+        address = "AA:BB:CC:DD:EE:FF"
+
+        assert auth.get_session_key(address) is None
+
+        auth.session_manager.create_session(address, b"k" * 32)
+        key = auth.get_session_key(address)
+        assert key == b"k" * 32
+        assert auth.get_session_key(address) is key
+
+        auth.session_manager.create_session(address, b"n" * 32)
+        assert auth.get_session_key(address) == b"n" * 32
+
+        auth.session_manager.remove_session(address)
+        assert auth.get_session_key(address) is None
+
+
+def test_authenticator_transaction_id_wraps():
+    """Test transaction IDs wrap around at the 8-bit boundary."""
+    auth = Authenticator()
+    auth.transaction_id = 254
+
+    assert auth._next_transaction_id() == 255
+    assert auth._next_transaction_id() == 0
+    assert auth._next_transaction_id() == 1
+
+
+def test_authenticator_random_pool():
+    """Test pooled random bytes are sized correctly and refill on demand."""
+    auth = Authenticator()
+
+    chunks = [auth._rand(20) for _ in range(40)]  # 800 bytes, several refills
+    assert all(len(chunk) == 20 for chunk in chunks)
+    assert len(set(chunks)) == len(chunks)
+    assert len(auth._rand(1000)) == 1000
+
+    auth.reset()
+    assert auth._rand_pool == b""
+
+    # start_pairing prefetches enough for the whole handshake
+    auth._rand_pool, auth._rand_off = b"\x00" * 10, 8
+    auth.start_pairing("AA:BB:CC:DD:EE:FF")
+    pool = auth._rand_pool
+    auth.handle_central_challenge_request(
+        CentralChallengeRequest(transaction_id=1, app_instance_id=1, central_challenge=b"c" * 8)
+    )
+    auth.handle_pump_challenge_request(PumpChallengeRequest(transaction_id=2, app_instance_id=1))
+    assert auth._rand_pool is pool
+
+
+def test_authentication_state_ordering():
+    """Test states are ordered by handshake progress and map to display names."""
+    from tandem_simulator.authentication.authenticator import _STATE_NAMES
+
+    assert len(_STATE_NAMES) == len(AuthenticationState)
+    assert _STATE_NAMES[AuthenticationState.IDLE] == "idle"
+    assert _STATE_NAMES[AuthenticationState.FAILED] == "failed"
+    assert AuthenticationState.JPAKE_ROUND1_SENT < AuthenticationState.AUTHENTICATED
+
+
 def test_authenticator_get_status():
     """Test getting authenticator status."""
     auth = Authenticator()
@@ -397,6 +918,80 @@ def test_authenticator_get_status():
     assert "session_stats" in status
     assert status["state"] == "idle"
 
+    auth.start_pairing("AA:BB:CC:DD:EE:FF")
+    refreshed = auth.get_status()
+    assert refreshed is not status
+    assert status["state"] == "idle"  # earlier snapshots are not updated
+    assert refreshed["state"] == "waiting_for_pairing_code"
+    assert refreshed["current_device"] == "AA:BB:CC:DD:EE:FF"
+
+
+def test_jpake4_hash_digest_precomputed():
+    """Test that a precomputed session-key hasher yields the same digest."""
+    from tandem_simulator.authentication.jpake_encoding import (
+        generate_jpake4_hash_digest,
+        precompute_jpake4_hasher,
+    )
+
+    session_key = b"k" * 32
+    hasher = precompute_jpake4_hasher(session_key)
+
+    for nonce in (b"\x01" * 8, b"\x02" * 8):
+        expected = generate_jpake4_hash_digest(session_key, "pump", nonce, b"\x00" * 8)
+        actual = generate_jpake4_hash_digest(
+            session_key, "pump", nonce, b"\x00" * 8, precomputed=hasher
+        )
+        assert actual == expected
+
+
+def test_jpake4_hash_digest_without_precomputed_hasher():
+    """Test digests computed without a precomputed hasher follow the given key."""
+    from tandem_simulator.authentication.jpake_encoding import generate_jpake4_hash_digest
+
+    nonce, reserved = b"\x03" * 8, b"\x00" * 8
+    for session_key in (b"a" * 32, b"a" * 32, b"b" * 32, b"a" * 32):
+        expected = hashlib.sha256(
+            session_key + b"JPake-Confirmation-app" + nonce + reserved
+        ).digest()
+        assert generate_jpake4_hash_digest(session_key, "app", nonce, reserved) == expected
+
+
+def test_ec_jpake_key_kp_layout():
+    """Test the encoded Key-Knowledge Proof decodes back to its fields."""
+    from tandem_simulator.authentication.jpake_encoding import (
+        decode_ec_jpake_key_kp,
+        encode_ec_jpake_key_kp,
+    )
+
+    point = JPakeProtocol(pairing_code="123456").generate_random_point()
+    data = encode_ec_jpake_key_kp(point)
+
+    assert len(data) == 165
+    assert data[130] == 34
+    point_x, zkp_v, zkp_r = decode_ec_jpake_key_kp(data)
+    assert point_x == point
+    assert len(zkp_v) == 65 and zkp_v[0] == 0x04
+    assert len(zkp_r) == 34
+
+    with pytest.raises(ValueError):
+        encode_ec_jpake_key_kp(point, b"\x00" * 97)
+
+
+def test_jpake_round1_pair_encoding():
+    """Test both Round 1 structures carry their own point and independent ZKP bytes."""
+    from tandem_simulator.authentication.jpake_encoding import (
+        decode_ec_jpake_key_kp,
+        decode_jpake_round1_pair,
+        encode_jpake_round1_pair,
+    )
+
+    g1, g2 = JPakeProtocol(pairing_code="123456").generate_round1()
+    jpake1a, jpake1b = encode_jpake_round1_pair(g1, g2)
+
+    assert len(jpake1a) == len(jpake1b) == 165
+    assert decode_jpake_round1_pair(jpake1a, jpake1b) == (g1, g2)
+    assert decode_ec_jpake_key_kp(jpake1a)[1:] != decode_ec_jpake_key_kp(jpake1b)[1:]
+
 
 # JPake Message Tests
 
@@ -64,6 +64,19 @@ def test_logger_creation():
     assert hasattr(logger, "error")
 
 
+def test_logger_lazy_formatting(caplog):
+    """Test that %-style arguments are passed through to the logging module."""
+    from tandem_simulator.utils.logger import get_logger
+
+    logger = get_logger()
+    with caplog.at_level("INFO", logger="tandem_simulator"):
+        logger.info("MTU negotiated for %s: %s bytes", "AA:BB", 185)
+        logger.debug("not emitted %s", object())
+
+    assert "MTU negotiated for AA:BB: 185 bytes" in caplog.messages
+    assert not any(m.startswith("not emitted") for m in caplog.messages)
+
+
 def test_gatt_server_creation():
     """Test that GATT server can be created."""
     from tandem_simulator.ble.gatt_server import GATTServer
@@ -84,6 +97,30 @@ def test_advertisement_creation():
     assert "tslim X2" in ad.device_name
 
 
+def test_ble_advertisement_properties_cache():
+    """Test assigning an advertised attribute rebuilds the cached properties."""
+    pytest.importorskip("dbus")
+    from tandem_simulator.ble.advertisement import LE_ADVERTISEMENT_IFACE, BLEAdvertisement
+
+    adv = BLEAdvertisement(None, 0)
+    props = adv.get_properties()
+    assert adv.get_properties() is props
+    assert "ServiceUUIDs" not in props[LE_ADVERTISEMENT_IFACE]
+
+    uuids = ["0000fdfb-0000-1000-8000-00805f9b34fb"]
+    adv.service_uuids = uuids
+    uuids.append("0000180a-0000-1000-8000-00805f9b34fb")  # caller's list is copied
+    assert list(adv.get_properties()[LE_ADVERTISEMENT_IFACE]["ServiceUUIDs"]) == uuids[:1]
+    with pytest.raises(AttributeError):
+        adv.service_uuids.append("0000180a-0000-1000-8000-00805f9b34fb")  # type: ignore
+
+    adv.local_name = "tslim X2 12345678"
+    assert adv.get_properties()[LE_ADVERTISEMENT_IFACE]["LocalName"] == "tslim X2 12345678"
+
+    adv.include_tx_power = False
+    assert "IncludeTxPower" not in adv.GetAll(LE_ADVERTISEMENT_IFACE)
+
+
 def test_connection_manager_creation():
     """Test that connection manager can be created."""
     from tandem_simulator.ble.connection import ConnectionManager
@@ -93,6 +130,21 @@ def test_connection_manager_creation():
     assert not cm.is_connected()
 
 
+def test_connection_manager_connected_at():
+    """Test connection time is recorded on the monotonic clock and shown as local time."""
+    from datetime import datetime, timedelta
+
+    from tandem_simulator.ble.connection import ConnectionManager
+
+    cm = ConnectionManager()
+    cm.handle_connection("AA:BB:CC:DD:EE:FF", "Phone")
+    info = cm.get_connection("AA:BB:CC:DD:EE:FF")
+
+    assert isinstance(info.connected_at_ns, int)
+    connected_at = datetime.fromisoformat(info.connected_at)
+    assert abs(datetime.now() - connected_at) < timedelta(seconds=1)
+
+
 def test_peripheral_creation():
     """Test that BLE peripheral can be created."""
     from tandem_simulator.ble.peripheral import BLEPeripheral
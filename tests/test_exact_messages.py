@@ -0,0 +1,137 @@
+"""Tests for the standalone EXACT message modules at the repository root."""
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tandem_simulator.protocol.message import MessageRegistry
+
+
+@pytest.fixture(scope="module")
+def cbs():
+    """Import CurrentBolusStatusResponse_EXACT without leaking its registrations."""
+    saved = dict(MessageRegistry._registry)
+    module = importlib.import_module("CurrentBolusStatusResponse_EXACT")
+    yield module
+    MessageRegistry._registry.clear()
+    MessageRegistry._registry.update(saved)
+
+
+def _bolus_payloads(cbs, count):
+    """Build count distinct bolus status payloads and their field values."""
+    rows = [(i % 3, 100 + i, 1000 + i, 50000 * i, i, 1 << (i % 8)) for i in range(count)]
+    buf = b"".join(cbs.CurrentBolusStatusResponse(0, *row).build_payload() for row in rows)
+    return buf, rows
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_cbs_parse_batch(cbs, monkeypatch, use_numpy):
+    """Test parse_batch decodes each payload with and without NumPy."""
+    if use_numpy:
+        np = pytest.importorskip("numpy")
+    else:
+        np = None
+        monkeypatch.setattr(cbs, "_numpy_backend", lambda: None)
+
+    buf, rows = _bolus_payloads(cbs, 4)
+    columns = cbs.parse_batch(buf + b"\xff" * 7, 4)  # trailing bytes are ignored
+
+    assert list(columns) == [
+        "status_id",
+        "bolus_id",
+        "timestamp",
+        "requested_volume",
+        "bolus_source_id",
+        "bolus_type_bitmask",
+    ]
+    # Columns are ndarrays with NumPy and plain lists without it
+    expected_type = np.ndarray if use_numpy else list
+    assert all(isinstance(column, expected_type) for column in columns.values())
+    for i, name in enumerate(columns):
+        assert [int(v) for v in columns[name]] == [row[i] for row in rows]
+
+    empty = cbs.parse_batch(b"", 0)
+    assert set(empty) == set(columns)
+    assert all(len(column) == 0 for column in empty.values())
+
+    with pytest.raises(ValueError):
+        cbs.parse_batch(buf[:-1], 4)
+    with pytest.raises(ValueError):
+        cbs.parse_batch(buf, -1)
+
+
+def test_cbs_import_does_not_load_numpy():
+    """Test NumPy is only imported once parse_batch needs it."""
+    code = (
+        "import sys, CurrentBolusStatusResponse_EXACT as m; "
+        "assert 'numpy' not in sys.modules; "
+        "m.parse_batch(b'', 0)"
+    )
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
+
+
+@pytest.fixture(scope="module")
+def pvr():
+    """Import PumpVersionResponse_EXACT."""
+    return importlib.import_module("PumpVersionResponse_EXACT")
+
+
+_PUMP_VERSION_FIELDS = (
+    105900,  # arm_sw_ver
+    3247,  # msp_sw_ver
+    0,  # config_a_bits
+    0,  # config_b_bits
+    90556643,  # serial_num
+    1005,  # part_num
+    "0",  # pump_rev
+    3213,  # pcba_sn
+    "A",  # pcba_rev
+    1000354,  # model_num
+)
+
+
+def test_pvr_parse_into_round_trip(pvr):
+    """Test parse_into refills an existing instance from a built payload."""
+    raw = pvr.PumpVersionResponse.build_cargo(*_PUMP_VERSION_FIELDS)
+    response = pvr.PumpVersionResponse(serial_num=1, pump_rev="stale")
+
+    assert response.parse_into(raw) is None
+    assert response.get_serial_num() == 90556643
+    assert response.get_pump_rev() == "0"
+    assert response.get_pcba_rev() == "A"
+    assert response.get_model_num() == 1000354
+    assert response.build_payload() == raw
+
+    with pytest.raises(ValueError):
+        response.parse_into(raw[:-1])
+
+
+def test_pvr_parse_tuple_round_trip(pvr):
+    """Test parse_tuple decodes the fields in wire order with raw string bytes."""
+    raw = pvr.PumpVersionResponse.build_cargo(*_PUMP_VERSION_FIELDS)
+    fields = pvr.parse_tuple(raw)
+
+    assert isinstance(fields, pvr.PumpVersionTuple)
+    assert fields.serial_num == 90556643
+    assert fields.pump_rev == b"0" + b"\x00" * 7
+    assert fields.pcba_rev == b"A" + b"\x00" * 7
+    assert fields[:6] == _PUMP_VERSION_FIELDS[:6]
+    assert pvr.PumpVersionResponse.parse(raw).get_pcba_sn() == fields.pcba_sn
+
+    with pytest.raises(ValueError):
+        pvr.parse_tuple(raw + b"\x00")
+
+
+def test_pvr_read_string_stops_at_first_null(pvr):
+    """Test fixed-length strings end at the first null, even with data after it."""
+    assert pvr.read_string(b"AB\x00CD\x00\x00\x00", 0, 8) == "AB"
+    assert pvr.read_string(b"xxAB\x00CD\x00\x00\x00", 2, 8) == "AB"
+    assert pvr.read_string(b"ABCDEFGHIJ", 0, 8) == "ABCDEFGH"
+
+    raw = bytearray(pvr.PumpVersionResponse.build_cargo(*_PUMP_VERSION_FIELDS))
+    raw[24:32] = b"AB\x00CD\x00\x00\x00"
+    assert pvr.PumpVersionResponse.parse(bytes(raw)).get_pump_rev() == "AB"
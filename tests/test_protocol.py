@@ -51,6 +51,20 @@ def test_message_registry():
     assert msg_class == TestMessage
 
 
+def test_message_registry_register_many():
+    """Test registering several message classes at once."""
+
+    class TestRequest(Message):
+        opcode = 0x44
+
+    class TestResponse(Message):
+        opcode = 0x45
+
+    MessageRegistry.register_many(((0x44, TestRequest), (0x45, TestResponse)))
+    assert MessageRegistry.get_message_class(0x44) == TestRequest
+    assert MessageRegistry.get_message_class(0x45) == TestResponse
+
+
 def test_message_header_parse():
     """Test message header parsing."""
     data = bytes([0x10, 0x05, 0x0A])  # opcode=0x10, txid=5, length=10